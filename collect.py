@@ -38,19 +38,16 @@ from pathlib import Path
 # 프로젝트 루트를 import 경로에 추가
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from src.dart_api import (
-    DartApiError,
-    REPORT_CODES,
-    download_corp_codes,
-    find_corp,
-    get_api_key,
-    CORP_XML_PATH,
-)
-from src.collector import collect_batch
+# src.dart_api.REPORT_CODES의 키와 동일. --help 시 src 패키지를 import하지 않도록 고정값 사용
+QUARTER_CHOICES = ["Q1", "H1", "Q3", "ANNUAL"]
 
 
 def cmd_collect(args: argparse.Namespace) -> int:
     """재무비율 데이터 수집."""
+    # 서브커맨드 실행 시점에 import (collector → s3_uploader 등 import 비용 지연)
+    from src.collector import collect_batch
+    from src.dart_api import DartApiError
+
     try:
         # --stock-codes가 지정되면 CSV 무시 (직접 입력 우선)
         companies_csv = None
@@ -66,11 +63,14 @@ def cmd_collect(args: argparse.Namespace) -> int:
             output_dir=Path(args.output_dir) if args.output_dir else None,
             api_key=args.api_key,
             delay=args.delay,
+            rate_per_sec=args.rate_per_sec,
             save_raw=args.save_raw,
             upload_s3=args.upload_s3,
             s3_bucket=args.s3_bucket,
             s3_region=args.s3_region,
             force=args.force,
+            max_workers=args.workers,
+            use_cache=not args.no_cache,
         )
         print(f"결과 파일 ({len(saved_files)}개):")
         for f in saved_files:
@@ -83,6 +83,14 @@ def cmd_collect(args: argparse.Namespace) -> int:
 
 def cmd_search(args: argparse.Namespace) -> int:
     """DART 기업코드 검색."""
+    from src.dart_api import (
+        CORP_XML_PATH,
+        DartApiError,
+        download_corp_codes,
+        find_corp,
+        get_api_key,
+    )
+
     try:
         api_key = get_api_key(args.api_key)
 
@@ -140,7 +148,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     collect_p.add_argument(
         "--quarters", nargs="+", default=None,
-        choices=list(REPORT_CODES.keys()),
+        choices=QUARTER_CHOICES,
         help="수집 분기 (기본: 전체). Q1, H1, Q3, ANNUAL"
     )
     collect_p.add_argument(
@@ -152,8 +160,16 @@ def build_parser() -> argparse.ArgumentParser:
         help="결과 CSV 저장 디렉터리 (기본: data/output/)"
     )
     collect_p.add_argument(
-        "--delay", type=float, default=0.5,
-        help="API 호출 간 대기(초). OpenDART 분당 제한 방지 (기본: 0.5)"
+        "--rate-per-sec", type=float, default=None,
+        help="초당 최대 API 호출 수. OpenDART 분당 제한 방지 (기본: 10, 0이면 무제한)"
+    )
+    collect_p.add_argument(
+        "--delay", type=float, default=None,
+        help="(deprecated) API 호출 간 간격(초). --rate-per-sec 사용 권장"
+    )
+    collect_p.add_argument(
+        "--workers", type=int, default=4,
+        help="동시 API 호출 스레드 수 (기본: 4)"
     )
     collect_p.add_argument(
         "--save-raw", action="store_true",
@@ -175,6 +191,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--force", action="store_true",
         help="중복 체크를 무시하고 전체 재수집 (기존 데이터 덮어쓰기)"
     )
+    collect_p.add_argument(
+        "--no-cache", action="store_true",
+        help="OpenDART 응답 로컬 캐시(data/cache/)를 사용하지 않음"
+    )
     collect_p.set_defaults(func=cmd_collect)
 
     # ── search ──
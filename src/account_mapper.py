@@ -39,6 +39,7 @@ OpenDART에서 반환하는 account_nm은 기업마다 표현이 다를 수 있
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
@@ -87,11 +88,65 @@ ACCOUNT_PATTERNS: list[tuple[str, str | None, str]] = [
 ]
 
 
+# ── 모듈 로드 시 1회 컴파일: sj_div별 패턴 묶음 + 병합 정규식 ─────
+# 병합 정규식은 각 패턴을 lookahead 대안으로 이어 붙여 re.match 한 번으로
+# "정의 순서상 처음으로 매칭되는 패턴"을 찾는다 (그룹명 접미사 = 묶음 내 순번).
+_PatternBucket = tuple[re.Pattern[str], list[tuple[str, re.Pattern[str]]]]
+
+
+def _build_bucket(patterns: list[tuple[str, str]]) -> _PatternBucket:
+    merged = re.compile("|".join(
+        f"(?=(?s:.*?)(?P<{key}__{i}>{pattern}))"
+        for i, (key, pattern) in enumerate(patterns)
+    ))
+    return merged, [(key, re.compile(pattern)) for key, pattern in patterns]
+
+
+def _build_buckets() -> dict[str | None, _PatternBucket]:
+    sj_divs = {sj for _, sj, _ in ACCOUNT_PATTERNS if sj is not None}
+    buckets: dict[str | None, _PatternBucket] = {}
+    for sj in [*sorted(sj_divs), None]:
+        patterns = [
+            (key, pattern) for key, filter_sj, pattern in ACCOUNT_PATTERNS
+            if filter_sj is None or filter_sj == sj
+        ]
+        if patterns:
+            buckets[sj] = _build_bucket(patterns)
+    return buckets
+
+
+_BUCKETS = _build_buckets()
+
+# 추출 가능한 전체 표준 키 (모두 채워지면 남은 항목은 볼 필요가 없음)
+STANDARD_KEYS: frozenset[str] = frozenset(key for key, _, _ in ACCOUNT_PATTERNS)
+
+
+@functools.lru_cache(maxsize=8192)
+def _match_keys(sj_div: str, account_nm: str) -> tuple[str, ...]:
+    """(sj_div, 계정명)에 매칭되는 표준 키를 패턴 정의 순서대로 반환.
+
+    계정명은 기업·분기가 달라도 대부분 반복되므로, 배치 수집 시
+    서로 다른 계정명마다 정규식 평가가 한 번만 일어나도록 캐시한다.
+    """
+    bucket = _BUCKETS.get(sj_div) or _BUCKETS.get(None)
+    if bucket is None:
+        return ()
+    merged, patterns = bucket
+    m = merged.match(account_nm)
+    if m is None:
+        return ()
+    pos = int(m.lastgroup.rsplit("__", 1)[1])
+    return (patterns[pos][0],) + tuple(
+        key for key, regex in patterns[pos + 1:] if regex.search(account_nm)
+    )
+
+
 def _parse_amount(raw: Any) -> float | None:
     """DART 금액 문자열 → float. 파싱 실패 시 None."""
     if raw is None:
         return None
-    s = str(raw).strip().replace(",", "").replace(" ", "")
+    # 앞뒤 공백·개행은 float()가 허용하므로 strip() 생략
+    s = (raw if type(raw) is str else str(raw)).replace(",", "").replace(" ", "")
     if not s or s == "-":
         return None
     try:
@@ -117,32 +172,30 @@ def extract_standard_items(
         }
     """
     result: dict[str, dict[str, float | None]] = {}
-    # 이미 매핑된 키는 중복 방지 (먼저 매칭된 것이 우선)
-    matched_keys: set[str] = set()
-
-    compiled = [
-        (key, sj_div, re.compile(pattern))
-        for key, sj_div, pattern in ACCOUNT_PATTERNS
-    ]
+    # 아직 매핑되지 않은 키 (먼저 매칭된 것이 우선, 이미 매핑된 키는 중복 방지)
+    remaining: set[str] = set(STANDARD_KEYS)
 
     for item in dart_items:
+        if not remaining:
+            break
         account_nm = (item.get("account_nm") or "").strip()
         sj_div = (item.get("sj_div") or "").strip()
         if not account_nm:
             continue
 
-        for std_key, filter_sj, regex in compiled:
-            if std_key in matched_keys:
-                continue
-            if filter_sj and sj_div != filter_sj:
-                continue
-            if regex.search(account_nm):
-                result[std_key] = {
-                    "thstrm": _parse_amount(item.get("thstrm_amount")),
-                    "frmtrm": _parse_amount(item.get("frmtrm_amount")),
-                    "bfefrmtrm": _parse_amount(item.get("bfefrmtrm_amount")),
-                }
-                matched_keys.add(std_key)
-                break
+        std_key = next(
+            (key for key in _match_keys(sj_div, account_nm)
+             if key in remaining),
+            None,
+        )
+        if std_key is None:
+            continue
+
+        result[std_key] = {
+            "thstrm": _parse_amount(item.get("thstrm_amount")),
+            "frmtrm": _parse_amount(item.get("frmtrm_amount")),
+            "bfefrmtrm": _parse_amount(item.get("bfefrmtrm_amount")),
+        }
+        remaining.discard(std_key)
 
     return result
@@ -8,23 +8,33 @@
 from __future__ import annotations
 
 import csv
-import json
+import gzip
+import os
+import queue
 import sys
-import time
+import warnings
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:  # 타입 힌트 전용 (requests 없이도 http.client 폴백으로 동작)
+    import requests
 
 from .dart_api import (
     DartApiError,
+    DEFAULT_RATE_PER_SEC,
     REPORT_CODES,
+    TokenBucket,
     fetch_financial_statements,
     get_api_key,
     resolve_corp_code,
 )
 from .account_mapper import extract_standard_items
+from .jsonio import dumps as _json_dumps, loads as _json_loads
 from .ratio_calculator import RATIO_NAMES, compute_all_ratios
-from .s3_uploader import upload_batch_to_s3
+from .s3_uploader import check_s3_access, upload_batch_to_s3
 
 # ── 기본 경로 ─────────────────────────────────────────────────
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
@@ -54,7 +64,7 @@ def _record_collected_companies(
     existing_codes: set[str] = set()
     existing_rows: list[dict[str, str]] = []
     if COLLECTED_CSV.exists():
-        with open(COLLECTED_CSV, newline="", encoding="utf-8-sig") as f:
+        with open(COLLECTED_CSV, newline="", encoding="utf-8-sig", buffering=_READ_BUFFER) as f:
             reader = csv.DictReader(f)
             for row in reader:
                 sc = (row.get("stock_code") or "").strip()
@@ -107,68 +117,77 @@ def _save_raw_json(
     quarter: str,
     fs_div: str,
 ) -> None:
-    """원본 재무제표 JSON을 data/raw/ 폴더에 저장."""
-    filename = f"{stock_code}_{year}_{quarter}_{fs_div}.json"
+    """원본 재무제표 JSON을 data/raw/ 폴더에 gzip 압축해 저장 (.json.gz, compact JSON)."""
+    filename = f"{stock_code}_{year}_{quarter}_{fs_div}.json.gz"
     path = RAW_DIR / filename
-    path.write_text(
-        json.dumps(raw_items, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    # mtime=0: 같은 데이터면 같은 바이트가 나오도록 헤더의 타임스탬프 고정
+    path.write_bytes(gzip.compress(_json_dumps(raw_items), compresslevel=6, mtime=0))
 
 
 # ── 중복 체크: 기존 CSV에서 수집 완료된 분기 목록 로드 ────────
 FIELDNAMES = ["stock_code", "corp_name", "year", "quarter", "label"] + RATIO_NAMES
+_RATIO_KEYS = tuple(RATIO_NAMES)
 
+# CSV 읽기 버퍼 (64 KiB): 기본 8 KiB 대비 read 시스템 호출 수를 줄인다.
+_READ_BUFFER = 1 << 16
 
-def _sector_dir(save_dir: Path, gics_sector: str) -> Path:
-    """GICS 섹터 서브디렉터리 경로를 반환."""
-    return save_dir / (gics_sector or "Unknown")
 
+def _scan_sector_files(sector_path: str | os.PathLike[str]) -> set[str]:
+    """섹터 디렉터리의 파일명 목록을 scandir 한 번으로 읽는다. 디렉터리가 없으면 빈 set."""
+    try:
+        with os.scandir(sector_path) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return set()
 
-def _load_existing_quarters(
-    save_dir: Path,
-    stock_code: str,
-    year: str,
-    gics_sector: str = "Unknown",
-) -> set[str]:
-    """기존 CSV에서 이미 수집된 분기 목록을 반환.
+
+# (분기 set, 이어 쓰기 기준 서수, 헤더, 원본 행 필드 리스트) — _scan_existing_file 참고
+ExistingScan = tuple[set[str], int | None, list[str], list[list[str]]]
+
+
+def _scan_existing_file(filepath: str | os.PathLike[str]) -> ExistingScan:
+    """기존 CSV를 한 번 읽어 중복 체크·이어 쓰기·병합에 필요한 정보를 반환.
+
+    행마다 dict를 만들지 않고 csv.reader의 필드 리스트를 그대로 보관하며
+    quarter 한 칸만 본다. 병합이 필요할 때 _existing_rows로 dict 행을 만들면
+    파일을 다시 읽지 않아도 된다.
 
     Returns:
-        {"Q1", "H1"} 형태의 set. 파일이 없으면 빈 set.
+        (분기 set, append_after, 헤더, 행 필드 리스트). append_after는 헤더가
+        FIELDNAMES와 같고 모든 행이 분기 순서대로 정렬돼 있을 때 마지막 행의
+        분기 서수(행이 없으면 -1), 그 밖에는 None. 파일이 없으면 (빈 set, None, [], []).
     """
-    filepath = _sector_dir(save_dir, gics_sector) / f"{stock_code}_{year}.csv"
-    if not filepath.exists():
-        return set()
     quarters: set[str] = set()
-    with open(filepath, newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            q = (row.get("quarter") or "").strip()
+    records: list[list[str]] = []
+    try:
+        f = open(filepath, newline="", encoding="utf-8-sig", buffering=_READ_BUFFER)
+    except FileNotFoundError:
+        return quarters, None, [], records
+    with f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return quarters, None, [], records
+        append_after: int | None = -1 if header == FIELDNAMES else None
+        qi = header.index("quarter") if "quarter" in header else None
+        for fields in reader:
+            if not fields:
+                continue
+            records.append(fields)
+            raw_q = fields[qi] if qi is not None and qi < len(fields) else ""
+            q = raw_q.strip()
             if q:
                 quarters.add(q)
-    return quarters
-
+            if append_after is not None:
+                ordinal = _Q_ORDINAL.get(raw_q)
+                append_after = ordinal if ordinal is not None and ordinal >= append_after else None
+    return quarters, append_after, header, records
 
-def _load_existing_rows(
-    save_dir: Path,
-    stock_code: str,
-    year: str,
-    gics_sector: str = "Unknown",
-) -> list[dict[str, Any]]:
-    """기존 CSV 파일의 모든 행을 읽어서 반환.
 
-    Returns:
-        행 리스트. 파일이 없으면 빈 리스트.
-    """
-    filepath = _sector_dir(save_dir, gics_sector) / f"{stock_code}_{year}.csv"
-    if not filepath.exists():
-        return []
-    rows: list[dict[str, Any]] = []
-    with open(filepath, newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(dict(row))
-    return rows
+def _existing_rows(scan: ExistingScan) -> list[dict[str, Any]]:
+    """_scan_existing_file 결과의 행을 헤더 기준 dict 리스트로 변환."""
+    _, _, header, records = scan
+    return [dict(zip(header, fields)) for fields in records]
 
 
 # ── CSV 입력 파싱 ─────────────────────────────────────────────
@@ -191,7 +210,7 @@ def load_company_list(csv_path: Path) -> list[dict[str, str]]:
         raise FileNotFoundError(f"기업 목록 파일이 없습니다: {csv_path}")
 
     rows: list[dict[str, str]] = []
-    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+    with open(csv_path, newline="", encoding="utf-8-sig", buffering=_READ_BUFFER) as f:
         reader = csv.DictReader(f)
         for row in reader:
             rows.append({k.strip(): (v or "").strip() for k, v in row.items()})
@@ -208,6 +227,10 @@ def collect_single(
     quarter: str,
     fs_div: str = "CFS",
     save_raw: bool = False,
+    limiter: TokenBucket | None = None,
+    use_cache: bool = False,
+    force: bool = False,
+    session: requests.Session | None = None,
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     """
     한 기업의 한 분기 재무비율을 수집.
@@ -220,7 +243,8 @@ def collect_single(
     reprt_code = REPORT_CODES[quarter]
     try:
         raw_items = fetch_financial_statements(
-            api_key, corp_code, year, reprt_code, fs_div
+            api_key, corp_code, year, reprt_code, fs_div,
+            limiter=limiter, use_cache=use_cache, force=force, session=session,
         )
     except DartApiError as e:
         print(f"  ⚠ API 오류 ({corp_name} {year}-{quarter}): {e}", file=sys.stderr)
@@ -245,7 +269,205 @@ def collect_single(
     return row, raw_items
 
 
+def _collect_with_fallback(
+    api_key: str,
+    corp_code: str,
+    stock_code: str,
+    corp_name: str,
+    year: str,
+    quarter: str,
+    fs_div: str,
+    save_raw: bool,
+    limiter: TokenBucket | None,
+    use_cache: bool,
+    force: bool,
+    session: requests.Session | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """collect_single + CFS 결과가 비어 있으면 OFS로 재시도."""
+    options = dict(
+        save_raw=save_raw, limiter=limiter, use_cache=use_cache, force=force, session=session,
+    )
+    row, raw_items = collect_single(
+        api_key, corp_code, stock_code, corp_name, year, quarter, fs_div, **options,
+    )
+    if fs_div == "CFS" and not any(row.get(k) is not None for k in _RATIO_KEYS):
+        row, raw_items = collect_single(
+            api_key, corp_code, stock_code, corp_name, year, quarter, "OFS", **options,
+        )
+    return row, raw_items
+
+
+_Q_ORDINAL = {q: i for i, q in enumerate(REPORT_CODES)}  # Q1, H1, Q3, ANNUAL → 0..3
+
+
+def _order_by_quarter(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """행을 분기 순서(Q1, H1, Q3, ANNUAL, 기타)로 배치.
+
+    분기 슬롯에 한 번씩 넣고 이어 붙이므로 정렬 없이 O(n)이며,
+    같은 분기 안에서는 입력 순서를 유지한다 (안정 정렬과 같은 결과).
+    """
+    slots: list[list[dict[str, Any]]] = [[] for _ in range(len(_Q_ORDINAL) + 1)]
+    other = len(_Q_ORDINAL)
+    for r in rows:
+        slots[_Q_ORDINAL.get(r.get("quarter", ""), other)].append(r)
+    return [r for slot in slots for r in slot]
+
+
+def _to_record(row: dict[str, Any]) -> list[Any]:
+    """행 dict를 FIELDNAMES 순서의 리스트로 변환 (없는 컬럼은 빈 값)."""
+    return [row.get(name, "") for name in FIELDNAMES]
+
+
+def _can_append(append_after: int | None, rows: list[dict[str, Any]]) -> bool:
+    """기존 CSV 뒤에 신규 행을 이어 쓰기만 해도 병합·정렬 결과와 같은지 판단.
+
+    기존 파일이 분기 순서대로 정렬돼 있고(append_after가 None이 아님),
+    신규 분기가 모두 그 뒤를 중복 없이 순서대로 이을 때만 True.
+    """
+    if append_after is None:
+        return False
+    last = append_after
+    for r in rows:
+        ordinal = _Q_ORDINAL.get(r.get("quarter", ""))
+        if ordinal is None or ordinal <= last:
+            return False
+        last = ordinal
+    return True
+
+
+def _write_group_csv(
+    save_dir: str | os.PathLike[str],
+    stock_code: str,
+    year: str,
+    gics_sector: str,
+    rows: list[dict[str, Any]],
+    force: bool = False,
+    existing: ExistingScan | None = None,
+) -> str:
+    """한 (종목코드, 연도) 그룹의 신규 행을 기존 CSV와 병합해 저장.
+
+    existing에 중복 체크 단계의 _scan_existing_file 결과를 넘기면 파일을 다시
+    읽지 않습니다. 기존 파일 뒤에 이어 쓰기만 하면 되는 경우(_can_append)에는
+    append 모드로 신규 행만 추가하고, 병합이 필요할 때는 스캔 결과의 행을 씁니다.
+    """
+    # 파일마다 Path 객체를 만들지 않도록 문자열 경로로 처리
+    sector_path = os.path.join(save_dir, gics_sector or "Unknown")
+    os.makedirs(sector_path, exist_ok=True)
+    filepath = os.path.join(sector_path, f"{stock_code}_{year}.csv")
+
+    # 기존 CSV 행 로드 (force면 무시)
+    if force:
+        merged = _order_by_quarter(rows)
+    else:
+        scan = existing if existing is not None else _scan_existing_file(filepath)
+        if _can_append(scan[1], rows):
+            with open(filepath, "a", newline="", encoding="utf-8-sig") as f:
+                csv.writer(f).writerows(_to_record(row) for row in rows)
+            print(f"  📄 {filepath}  ({len(scan[3]) + len(rows)}행)", file=sys.stderr)
+            return filepath
+
+        # 기존 분기 + 신규 분기 병합 (기존 행 우선), 분기 순서대로 배치
+        existing_rows = _existing_rows(scan)
+        existing_q_set = {r.get("quarter") for r in existing_rows}
+        merged = _order_by_quarter(chain(
+            existing_rows, (r for r in rows if r["quarter"] not in existing_q_set),
+        ))
+
+    with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(_to_record(row) for row in merged)
+    print(f"  📄 {filepath}  ({len(merged)}행)", file=sys.stderr)
+    return filepath
+
+
+# ── 체크포인트 (WAL): 수집한 행을 즉시 한 줄씩 기록해 중단 시 복구 ──
+PENDING_WAL = ".pending.jsonl"
+_WAL_FORCE = "_force"  # --force 실행에서 기록한 행 표시 (CSV 컬럼 아님)
+
+
+def _replay_pending(save_dir: Path) -> int:
+    """이전 실행이 중단되며 남긴 WAL의 행을 CSV에 병합하고 WAL을 삭제.
+
+    이미 CSV에 있는 분기는 기존 행을 유지하므로 여러 번 복구해도 안전합니다.
+    --force 실행이 남긴 행은 같은 분기의 기존 행을 대체하고, WAL에 없는
+    분기의 기존 행은 그대로 둡니다 (이 경우도 여러 번 복구해도 결과가 같음).
+
+    Returns:
+        복구한 행 수
+    """
+    wal_path = save_dir / PENDING_WAL
+    if not wal_path.exists():
+        return 0
+
+    groups: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
+    forced: set[tuple[str, str, str]] = set()
+    with open(wal_path, "rb") as f:
+        for line in f:
+            try:
+                row = _json_loads(line)
+            except ValueError:
+                continue  # 중단 시점에 잘린 마지막 줄
+            grp_key = (row["stock_code"], row["year"], row.get("gics_sector", "Unknown"))
+            groups[grp_key].append(row)
+            if row.pop(_WAL_FORCE, False):
+                forced.add(grp_key)
+
+    replayed = sum(len(rows) for rows in groups.values())
+    print(f"  ♻ 중단된 수집 복구: {replayed}행 ({wal_path})", file=sys.stderr)
+    for grp_key, rows in groups.items():
+        sc, yr, gics = grp_key
+        if grp_key in forced:
+            # 새 행이 있는 분기만 교체하고 나머지 기존 행은 유지해 통째로 덮어쓴다
+            filepath = os.path.join(save_dir, gics or "Unknown", f"{sc}_{yr}.csv")
+            new_q_set = {r.get("quarter") for r in rows}
+            kept = [
+                r for r in _existing_rows(_scan_existing_file(filepath))
+                if r.get("quarter") not in new_q_set
+            ]
+            _write_group_csv(save_dir, sc, yr, gics, kept + rows, force=True)
+        else:
+            _write_group_csv(save_dir, sc, yr, gics, rows)
+    wal_path.unlink()
+    return replayed
+
+
 # ── 배치 수집 ─────────────────────────────────────────────────
+_QUEUE_END = object()  # 업로드 큐 종료 신호
+_S3_QUEUE_SIZE = 64  # 업로드를 기다리는 원본 데이터 최대 건수 (메모리 상한)
+
+
+def _drain_queue(q: queue.Queue) -> Iterator[dict[str, Any]]:
+    """종료 신호를 받을 때까지 큐에서 항목을 꺼내 내보낸다."""
+    while True:
+        item = q.get()
+        if item is _QUEUE_END:
+            return
+        yield item
+
+
+def _put_while_alive(q: queue.Queue, item: Any, consumer: Future) -> bool:
+    """consumer가 살아 있는 동안 q에 item을 넣는다.
+
+    큐가 가득 찬 채로 consumer가 죽어도 영원히 막히지 않도록 짧게 기다리며
+    재시도하고, consumer가 이미 끝났으면 넣지 않고 False를 반환한다.
+    """
+    while not consumer.done():
+        try:
+            q.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _raise_if_uploader_stopped(uploader: Future) -> None:
+    """백그라운드 업로드가 수집 도중 끝났으면 그 예외를 바로 올린다."""
+    if uploader.done():
+        uploader.result()
+        raise RuntimeError("S3 업로드 스레드가 수집 도중 종료되었습니다.")
+
+
 def collect_batch(
     stock_codes: list[str] | None = None,
     corp_codes: list[str] | None = None,
@@ -255,12 +477,16 @@ def collect_batch(
     fs_div: str = "CFS",
     output_dir: Path | None = None,
     api_key: str | None = None,
-    delay: float = 0.5,
+    delay: float | None = None,
     save_raw: bool = False,
     upload_s3: bool = False,
     s3_bucket: str | None = None,
     s3_region: str | None = None,
     force: bool = False,
+    max_workers: int = 4,
+    use_cache: bool = True,
+    rate_per_sec: float | None = None,
+    session: requests.Session | None = None,
 ) -> list[Path]:
     """
     여러 기업 × 연도 × 분기의 재무비율을 수집하여 CSV 저장.
@@ -268,6 +494,8 @@ def collect_batch(
     파일명 규칙: {종목코드}_{연도}.csv  (예: 019440_2023.csv)
     각 기업 × 연도별로 별도의 CSV 파일로 저장됩니다.
     이미 수집된 (종목코드, 연도, 분기) 조합은 건너뛰고 누락 분기만 추가합니다.
+    API 호출은 max_workers개 스레드로 동시에 수행하되, 모든 스레드가 공유하는
+    토큰 버킷으로 전체 호출 속도를 rate_per_sec 이하로 유지합니다.
 
     사용 방식 두 가지:
     1) companies_csv 지정 → CSV에서 기업 목록 로드
@@ -282,18 +510,26 @@ def collect_batch(
         fs_div: "CFS" (연결) 또는 "OFS" (별도)
         output_dir: 결과 CSV 저장 디렉터리 (기본: data/output/)
         api_key: DART API 키
-        delay: API 호출 간 대기 시간(초)
+        delay: (deprecated) API 호출 간 간격(초). rate_per_sec = 1/delay 로 변환
         save_raw: 원본 재무제표 JSON을 data/raw/에 저장할지 여부
         upload_s3: 원본 재무제표를 S3에 업로드할지 여부
         s3_bucket: S3 버킷 이름 (없으면 .env에서 읽기)
         s3_region: AWS 리전 (없으면 .env에서 읽기)
-        force: True이면 중복 체크를 무시하고 전체 재수집
+        force: True이면 중복 체크와 응답 캐시를 무시하고 전체 재수집
+        max_workers: 동시 API 호출 스레드 수
+        use_cache: OpenDART 응답 로컬 캐시(data/cache/) 사용 여부
+        rate_per_sec: 초당 최대 API 호출 수 (기본: DEFAULT_RATE_PER_SEC, 0이면 무제한)
+        session: 모든 스레드가 공유할 HTTP 세션 (기본: dart_api 전역 keep-alive 세션,
+            연결 풀 32개). max_workers가 32보다 크면 build_session(pool_maxsize=...)으로 만들어 전달
 
     Returns:
         저장된 CSV 파일 경로 리스트
     """
     _ensure_dirs(save_raw=save_raw)
     key = get_api_key(api_key)
+    if upload_s3:
+        # 설정·인증 오류는 수집을 시작하기 전에 드러낸다.
+        check_s3_access(s3_bucket, s3_region)
 
     if quarters is None:
         quarters = list(REPORT_CODES.keys())
@@ -330,6 +566,8 @@ def collect_batch(
     # ── 저장 디렉터리 결정 ────────────────────────────────────────
     save_dir = output_dir if output_dir else OUTPUT_DIR
     save_dir.mkdir(parents=True, exist_ok=True)
+    save_dir_str = os.fspath(save_dir)
+    _replay_pending(save_dir)
 
     # ── 기업별 연도 범위 결정 헬퍼 ────────────────────────────
     def _resolve_years(comp: dict[str, str]) -> list[str]:
@@ -342,30 +580,47 @@ def collect_batch(
 
     # ── 중복 체크를 위한 기존 데이터 로드 ───────────────────────
     # existing_quarters[(stock_code, year)] = {"Q1", "H1", ...}
+    # existing_files[(stock_code, year, gics_sector)] = _scan_existing_file 결과 — 저장 단계에서 재사용
+    # 섹터 디렉터리마다 scandir 한 번으로 파일명을 모아 두고, 실제 존재하는 파일만 읽는다.
     existing_quarters: dict[tuple[str, str], set[str]] = {}
+    existing_files: dict[tuple[str, str, str], ExistingScan] = {}
     if not force:
+        sector_files: dict[str, set[str]] = {}
         for comp in companies:
             sc = comp.get("stock_code", "")
             gics = comp.get("gics_sector", "Unknown")
             if not sc:
                 continue
+            sector_path = os.path.join(save_dir_str, gics or "Unknown")
+            names = sector_files.get(sector_path)
+            if names is None:
+                names = sector_files[sector_path] = _scan_sector_files(sector_path)
             for yr in _resolve_years(comp):
-                eq = _load_existing_quarters(save_dir, sc, yr, gics)
+                filename = f"{sc}_{yr}.csv"
+                if filename not in names:
+                    continue
+                scan = existing_files[(sc, yr, gics)] = _scan_existing_file(
+                    os.path.join(sector_path, filename),
+                )
+                eq = scan[0]
                 if eq:
                     existing_quarters[(sc, yr)] = eq
 
-    # ── 결과 수집 ──────────────────────────────────────────────
-    new_rows: list[dict[str, Any]] = []
-    s3_upload_queue: list[dict[str, Any]] = []
+    # ── 수집 대상 작업 목록 구성 (중복 체크) ─────────────────────
+    jobs: list[tuple[dict[str, str], str, str]] = []
     total = sum(len(_resolve_years(c)) * len(quarters) for c in companies)
     done = 0
     skipped = 0
+    # 진행률은 약 1% 단위로만 출력 (작은 배치는 매 건 출력). 오류·경고는 항상 출력.
+    progress_step = max(1, total // 100)
+
+    def _should_report(n: int) -> bool:
+        return n % progress_step == 0 or n == total
 
     for comp in companies:
         cc = comp.get("corp_code", "")
         sc = comp.get("stock_code", "")
         cn = comp.get("corp_name", "")
-        gics = comp.get("gics_sector", "Unknown")
         comp_years = _resolve_years(comp)
         if not cc:
             print(f"  ⏭ 건너뜀 (corp_code 없음): {sc} {cn}", file=sys.stderr)
@@ -374,103 +629,155 @@ def collect_batch(
 
         for yr in comp_years:
             for q in quarters:
-                done += 1
-
                 # ── 중복 체크 ──
                 if not force and q in existing_quarters.get((sc, yr), set()):
-                    print(
-                        f"  [{done}/{total}] {cn or sc} {yr}-{q} ... "
-                        f"⏭ 이미 수집됨 (SKIP)",
-                        file=sys.stderr,
-                    )
+                    done += 1
+                    if _should_report(done):
+                        print(
+                            f"  [{done}/{total}] {cn or sc} {yr}-{q} ... "
+                            f"⏭ 이미 수집됨 (SKIP)",
+                            file=sys.stderr,
+                        )
                     skipped += 1
                     continue
-
-                print(f"  [{done}/{total}] {cn or sc} {yr}-{q} ... 수집 중", file=sys.stderr)
-
-                # CFS 시도 → 실패하면 OFS 폴백
-                row, raw_items = collect_single(key, cc, sc, cn, yr, q, fs_div, save_raw=save_raw)
-                if fs_div == "CFS" and all(row.get(n) is None for n in RATIO_NAMES):
-                    row, raw_items = collect_single(key, cc, sc, cn, yr, q, "OFS", save_raw=save_raw)
-
-                row["label"] = comp.get("label", "")
-                row["gics_sector"] = gics  # 섹터별 디렉터리 저장용
-                new_rows.append(row)
-
-                # S3 업로드 대기열에 추가
-                if upload_s3 and raw_items:
-                    s3_upload_queue.append({
-                        "raw_items": raw_items,
-                        "stock_code": sc,
-                        "year": yr,
-                        "quarter": q,
-                        "gics_sector": gics,
-                    })
-
-                if delay > 0:
-                    time.sleep(delay)
-
-    # ── CSV 저장: 기존 데이터 + 신규 데이터 병합 ──────────────
-    # 신규 데이터를 (stock_code, year, gics_sector) 기준으로 그룹핑
-    new_groups: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
-    for row in new_rows:
-        grp_key = (row["stock_code"], row["year"], row.get("gics_sector", "Unknown"))
-        new_groups[grp_key].append(row)
-
-    saved_files: list[Path] = []
-    quarter_order = list(REPORT_CODES.keys())  # Q1, H1, Q3, ANNUAL
-
-    # 신규 데이터가 있는 파일만 저장 (섹터별 서브디렉터리)
-    for (sc, yr, gics), rows in new_groups.items():
-        sector_path = _sector_dir(save_dir, gics)
-        sector_path.mkdir(parents=True, exist_ok=True)
-
-        # 기존 CSV 행 로드 (force면 무시)
-        if force:
-            merged = rows
+                jobs.append((comp, yr, q))
+
+    # ── 결과 수집: 스레드 풀 동시 호출, 호출 속도는 토큰 버킷이 전역으로 보장 ──
+    if rate_per_sec is None:
+        if delay is not None:
+            warnings.warn(
+                "delay는 더 이상 권장되지 않습니다. rate_per_sec을 사용하세요.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            rate_per_sec = 1.0 / delay if delay > 0 else 0.0
         else:
-            existing_rows = _load_existing_rows(save_dir, sc, yr, gics)
-            # 기존 분기 + 신규 분기 병합
-            existing_q_set = {r.get("quarter") for r in existing_rows}
-            merged = list(existing_rows)
-            for r in rows:
-                if r["quarter"] not in existing_q_set:
-                    merged.append(r)
-
-        # 분기 순서대로 정렬
-        merged.sort(key=lambda r: quarter_order.index(r.get("quarter", "")) if r.get("quarter", "") in quarter_order else 99)
-
-        filename = f"{sc}_{yr}.csv"
-        filepath = sector_path / filename
-        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=FIELDNAMES, extrasaction="ignore")
-            writer.writeheader()
-            for row in merged:
-                writer.writerow(row)
-        saved_files.append(filepath)
-        print(f"  📄 {filepath}  ({len(merged)}행)", file=sys.stderr)
-
-    collected = len(new_rows)
+            rate_per_sec = DEFAULT_RATE_PER_SEC
+    limiter = TokenBucket(rate_per_sec)
+
+    def _run(job: tuple[dict[str, str], str, str]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        comp, yr, q = job
+        return _collect_with_fallback(
+            key, comp["corp_code"], comp.get("stock_code", ""),
+            comp.get("corp_name", ""), yr, q, fs_div, save_raw, limiter,
+            use_cache, force, session,
+        )
+
+    # ── CSV 저장: (stock_code, year, gics_sector) 그룹의 작업이 모두 끝나는 즉시 기록 ──
+    # 그룹별 남은 작업 수. 0이 되면 기존 CSV와 병합해 저장하고 메모리에서 내린다.
+    group_of: list[tuple[str, str, str]] = []
+    pending: dict[tuple[str, str, str], int] = {}
+    for comp, yr, q in jobs:
+        grp_key = (comp.get("stock_code", ""), yr, comp.get("gics_sector", "Unknown"))
+        group_of.append(grp_key)
+        pending[grp_key] = pending.get(grp_key, 0) + 1
+    group_rank = {grp_key: rank for rank, grp_key in enumerate(pending)}
+    # 신규 작업이 없는 기존 파일은 다시 쓰지 않으므로 스캔 결과를 버린다.
+    existing_files = {k: v for k, v in existing_files.items() if k in pending}
+
+    # ── S3 업로드: 백그라운드 스레드가 큐를 비우며 수집과 동시에 업로드 ──
+    s3_queue: queue.Queue | None = None
+    s3_pool: ThreadPoolExecutor | None = None
+    s3_future: Future | None = None
+    if upload_s3:
+        s3_queue = queue.Queue(maxsize=_S3_QUEUE_SIZE)
+        s3_pool = ThreadPoolExecutor(max_workers=1)
+        s3_future = s3_pool.submit(
+            upload_batch_to_s3,
+            _drain_queue(s3_queue),
+            bucket=s3_bucket,
+            region=s3_region,
+            force=force,
+        )
+
+    buffered: dict[tuple[str, str, str], list[tuple[int, dict[str, Any]]]] = defaultdict(list)
+    saved: dict[tuple[str, str, str], str] = {}
+    collected_codes: set[str] = set()
+    s3_count = 0
+    # 수집한 행은 CSV 그룹이 완성되기 전에 WAL에 먼저 기록 (줄 단위로 즉시 flush)
+    wal_path = save_dir / PENDING_WAL
+    wal = open(wal_path, "ab", buffering=0) if jobs else None
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {executor.submit(_run, job): i for i, job in enumerate(jobs)}
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    comp, yr, q = jobs[i]
+                    row, raw_items = future.result()
+                    sc = comp.get("stock_code", "")
+                    cn = comp.get("corp_name", "")
+                    gics = comp.get("gics_sector", "Unknown")
+                    done += 1
+                    if _should_report(done):
+                        print(f"  [{done}/{total}] {cn or sc} {yr}-{q} ... 수집 완료", file=sys.stderr)
+
+                    row["label"] = comp.get("label", "")
+                    row["gics_sector"] = gics  # 섹터별 디렉터리 저장용
+                    if wal is not None:
+                        # --force 실행이면 복구 시에도 기존 행보다 새 행을 우선하도록 표시
+                        wal.write(_json_dumps({**row, _WAL_FORCE: True} if force else row) + b"\n")
+
+                    # S3 업로드 대상 (업로드가 실패했으면 수집도 바로 중단)
+                    if s3_future is not None:
+                        _raise_if_uploader_stopped(s3_future)
+                    if s3_queue is not None and raw_items:
+                        if s3_count == 0:
+                            print("\n☁️  S3 업로드 시작 (수집과 병행)...", file=sys.stderr)
+                        s3_count += 1
+                        entry = {
+                            "raw_items": raw_items,
+                            "stock_code": sc,
+                            "year": yr,
+                            "quarter": q,
+                            "gics_sector": gics,
+                        }
+                        if not _put_while_alive(s3_queue, entry, s3_future):
+                            _raise_if_uploader_stopped(s3_future)
+
+                    grp_key = group_of[i]
+                    buffered[grp_key].append((i, row))
+                    pending[grp_key] -= 1
+                    if pending[grp_key] == 0:
+                        # 작업 순번대로 정렬해 순차 실행과 같은 행 순서를 유지
+                        rows = [r for _, r in sorted(buffered.pop(grp_key), key=lambda t: t[0])]
+                        saved[grp_key] = _write_group_csv(
+                            save_dir_str, *grp_key, rows, force=force,
+                            existing=existing_files.pop(grp_key, None),
+                        )
+                        collected_codes.add(row["stock_code"])
+            except BaseException:
+                # 작업 하나가 실패하거나 Ctrl-C로 중단되면 대기 중인 작업을 취소해
+                # 순차 실행처럼 그 자리에서 멈춘다 (진행 중인 작업만 마무리).
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        if wal is not None:
+            wal.close()
+        # 수집이 예외로 끝나도 업로드 스레드가 큐에서 영원히 기다리지 않도록 종료 신호를 보낸다.
+        if s3_queue is not None:
+            _put_while_alive(s3_queue, _QUEUE_END, s3_future)
+            s3_pool.shutdown(wait=True)
+
+    # 모든 그룹이 CSV에 기록됐으므로 WAL은 더 이상 필요 없다.
+    if wal is not None:
+        wal_path.unlink(missing_ok=True)
+
+    saved_files = [Path(saved[g]) for g in sorted(saved, key=group_rank.__getitem__)]
+    collected = len(jobs)
     print(
         f"\n✅ 완료: 신규 {collected}건 수집, {skipped}건 스킵"
         f"  ({len(saved_files)}개 파일 저장)",
         file=sys.stderr,
     )
 
-    # ── S3 업로드 ─────────────────────────────────────────────
-    if upload_s3 and s3_upload_queue:
-        print(f"\n☁️  S3 업로드 시작 ({len(s3_upload_queue)}개 파일)...", file=sys.stderr)
-        upload_batch_to_s3(
-            s3_upload_queue,
-            bucket=s3_bucket,
-            region=s3_region,
-            force=force,
-        )
+    # 업로드 중 발생한 예외는 여기서 다시 올린다.
+    if s3_future is not None:
+        s3_future.result()
 
     # ── 수집 완료 기업 기록 ───────────────────────────────────
     if saved_files and companies_csv:
         # CSV 저장이 실제로 이루어진 종목코드만 기록
-        collected_codes = {row["stock_code"] for row in new_rows}
         _record_collected_companies(companies, collected_codes)
 
     return saved_files
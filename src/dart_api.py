@@ -2,18 +2,49 @@
 
 from __future__ import annotations
 
-import json
+import bisect
+import functools
+import gzip
+import hashlib
+import http.client
+import itertools
 import os
+import pickle
+import shutil
 import ssl
+import tempfile
+import threading
 import time
+import urllib.error
 import urllib.parse
-import urllib.request
+import warnings
 import xml.etree.ElementTree as ET
 import zipfile
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:  # requests 미설치 시 http.client keep-alive 연결로 폴백
+    requests = None
+
+try:
+    import certifi
+except ImportError:  # certifi 미설치 시 시스템 기본 인증서 사용
+    certifi = None
+
+from .dart_cache import cache_get, cache_put
+from .env import load_env
+from .jsonio import dumps as _json_dumps, loads as _json_loads
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # lxml 미설치 시 표준 ElementTree로 폴백
+    _lxml_etree = None
+
 # ── 엔드포인트 ────────────────────────────────────────────────
 BASE_URL = "https://opendart.fss.or.kr/api"
 CORP_CODE_ENDPOINT = f"{BASE_URL}/corpCode.xml"
@@ -28,37 +59,29 @@ REPORT_CODES = {
 }
 
 # ── 기본 경로 ─────────────────────────────────────────────────
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
 CORP_XML_PATH = DATA_DIR / "corpCode.xml"
 
+# corpCode 인덱스 컬럼 (XML 파싱 결과를 컬럼별 리스트로 캐시)
+CORP_FIELDS = ("corp_code", "corp_name", "stock_code", "modify_date")
+# 기업명 검색용 소문자 컬럼 (인덱스에만 존재, 결과 행에는 포함하지 않음)
+CORP_NAME_LOWER = "corp_name_lower"
+
 
 class DartApiError(Exception):
     """OpenDART API 호출 오류."""
 
 
 # ── 환경 변수 / .env 파일 읽기 ────────────────────────────────
-def _read_env_file(path: Path) -> dict[str, str]:
-    env: dict[str, str] = {}
-    if not path.exists():
-        return env
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        env[key.strip()] = value.strip().strip('"').strip("'")
-    return env
-
-
 def get_api_key(explicit_key: str | None = None) -> str:
     """DART API 키를 반환. 우선순위: 인자 > 환경변수 > .env 파일."""
     if explicit_key:
         return explicit_key
-    project_root = Path(__file__).resolve().parent.parent
-    env = _read_env_file(project_root / ".env")
-    key = os.getenv("DART_API_KEY") or env.get("DART_API_KEY")
+    # 환경변수가 있으면 .env 파일은 읽지 않음
+    key = os.getenv("DART_API_KEY")
+    if not key:
+        key = load_env().get("DART_API_KEY")
     if not key:
         raise DartApiError(
             "API 키가 없습니다. DART_API_KEY 환경변수를 설정하거나 .env 파일에 추가하세요."
@@ -67,49 +90,405 @@ def get_api_key(explicit_key: str | None = None) -> str:
 
 
 # ── HTTP 유틸 ─────────────────────────────────────────────────
-def _http_get(url: str, params: dict[str, str], timeout: int = 30) -> bytes:
-    query = urllib.parse.urlencode(params)
-    full_url = f"{url}?{query}"
-    req = urllib.request.Request(full_url, method="GET")
-    context = None
-    try:
-        import certifi
-        context = ssl.create_default_context(cafile=certifi.where())
-    except Exception:
-        context = None
-    with urllib.request.urlopen(req, timeout=timeout, context=context) as resp:
-        return resp.read()
+# 재시도 대상 상태 코드와 최대 재시도 횟수 (requests 세션·http.client 폴백 공통)
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+_MAX_RETRIES = 5
+
+
+def build_session(pool_maxsize: int = 32) -> requests.Session:
+    """keep-alive 커넥션 풀 + 재시도(429/5xx 지수 백오프)가 설정된 세션.
+
+    pool_maxsize는 동시에 유지할 연결 수로, 수집 스레드 수 이상이어야
+    스레드마다 TLS 핸드셰이크를 다시 하지 않는다.
+    """
+    if requests is None:
+        raise RuntimeError(
+            "requests가 설치되어 있지 않습니다. pip install requests 를 실행하세요."
+        )
+    session = requests.Session()
+    retry = Retry(
+        total=_MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=list(_RETRY_STATUS),
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# 모듈 전역 세션: 같은 호스트(opendart.fss.or.kr)로의 TCP/TLS 연결을 재사용
+_SESSION = build_session() if requests is not None else None
+
+# requests가 없을 때 쓰는 http.client 연결: HTTPSConnection은 스레드 간에
+# 공유할 수 없으므로 스레드마다 호스트별로 하나씩 열어 두고 재사용한다.
+# SSL 컨텍스트(인증서 로드)는 모듈 로드 시 한 번만 만든다.
+def _build_ssl_context() -> ssl.SSLContext:
+    """certifi 인증서로 SSL 컨텍스트 생성. certifi가 없거나 번들을 못 읽으면 시스템 기본값."""
+    if certifi is not None:
+        try:
+            return ssl.create_default_context(cafile=certifi.where())
+        except (OSError, ssl.SSLError):
+            pass
+    return ssl.create_default_context()
+
+
+_SSL_CONTEXT = _build_ssl_context()
+_conn_local = threading.local()
+
+
+# OpenDART 권장 호출 속도 (분당 1,000회 이상은 이용 제한 → 여유를 두고 초당 10회)
+DEFAULT_RATE_PER_SEC = 10.0
+
+
+class TokenBucket:
+    """여러 스레드가 공유하는 토큰 버킷 호출 속도 제한기.
+
+    초당 rate_per_sec개씩 토큰이 충전되고 최대 capacity개까지 쌓인다.
+    acquire()는 토큰 하나를 예약하고, 부족하면 충전될 때까지만 대기한다.
+    OpenDART 호출 제한은 API 키 단위이므로 배치 전체에서 하나를 공유한다.
+    rate_per_sec <= 0 이면 제한하지 않는다.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float | None = None) -> None:
+        self.rate = rate_per_sec
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_sec)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _host_connection(host: str, timeout: int) -> http.client.HTTPSConnection:
+    """현재 스레드의 host 전용 keep-alive 연결 (없으면 생성)."""
+    conns = getattr(_conn_local, "conns", None)
+    if conns is None:
+        conns = _conn_local.conns = {}
+    conn = conns.get(host)
+    if conn is None:
+        conn = http.client.HTTPSConnection(host, timeout=timeout, context=_SSL_CONTEXT)
+        conns[host] = conn
+    return conn
+
+
+def _conn_get(
+    url: str, params: dict[str, str], timeout: int, accept_gzip: bool = False,
+) -> tuple[http.client.HTTPSConnection, http.client.HTTPResponse]:
+    """http.client로 GET 요청을 보내고 (연결, 응답)을 반환.
+
+    서버가 유휴 keep-alive 연결을 끊었으면 한 번 재연결하고, 429/5xx는
+    requests 세션과 같은 횟수만큼 지수 백오프로 재시도한다. 응답 본문은
+    호출자가 끝까지 읽어야 다음 요청에서 연결을 재사용할 수 있다.
+    accept_gzip=True면 gzip 압축 응답을 요청한다 (해제는 호출자 몫).
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{urllib.parse.urlencode(params)}"
+    headers = {"Accept-Encoding": "gzip"} if accept_gzip else {}
+    reconnected = False
+    attempt = 0
+    while True:
+        conn = _host_connection(parts.netloc, timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+        except (http.client.BadStatusLine, ConnectionError):
+            # RemoteDisconnected 등: 끊긴 연결을 닫고 새 연결로 한 번만 재시도
+            conn.close()
+            if reconnected:
+                raise
+            reconnected = True
+            continue
+        except Exception:
+            # 타임아웃·SSL 오류 등: 요청 중 상태로 남은 연결을 재사용하지 않도록 닫는다
+            conn.close()
+            raise
+        if resp.status in _RETRY_STATUS and attempt < _MAX_RETRIES:
+            resp.read()
+            time.sleep(0.5 * (2 ** attempt))
+            attempt += 1
+            continue
+        if resp.status >= 400:
+            resp.read()
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return conn, resp
+
+
+def _http_get(
+    url: str,
+    params: dict[str, str],
+    timeout: int = 30,
+    session: requests.Session | None = None,
+) -> bytes:
+    if session is None and _SESSION is None:
+        # requests는 gzip을 자동으로 요청·해제하므로 http.client 폴백에서도 맞춘다
+        conn, resp = _conn_get(url, params, timeout, accept_gzip=True)
+        try:
+            data = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            data = gzip.decompress(data)
+        return data
+    resp = (session or _SESSION).get(url, params=params, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
+
+
+def _http_stream(
+    url: str, params: dict[str, str], dst: Path, timeout: int = 30,
+) -> Path:
+    """응답 본문을 메모리에 모으지 않고 64KiB 단위로 dst 파일에 기록."""
+    if _SESSION is None:
+        conn, resp = _conn_get(url, params, timeout)
+        try:
+            with open(dst, "wb") as f:
+                shutil.copyfileobj(resp, f, 65536)
+        except Exception:
+            conn.close()
+            raise
+        return dst
+    with _SESSION.get(url, params=params, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        with open(dst, "wb") as f:
+            for chunk in resp.iter_content(chunk_size=65536):
+                f.write(chunk)
+    return dst
 
 
 # ── 기업 코드 관련 ────────────────────────────────────────────
+def _copy_with_digest(src: Any, dst: Any) -> str:
+    """src → dst로 64KiB 단위 복사하면서 내용의 blake2b(128bit) 해시(hex)를 계산."""
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: src.read(65536), b""):
+        h.update(chunk)
+        dst.write(chunk)
+    return h.hexdigest()
+
+
 def download_corp_codes(api_key: str, out_path: Path = CORP_XML_PATH) -> Path:
-    """OpenDART에서 기업코드 XML 다운로드."""
+    """OpenDART에서 기업코드 XML 다운로드.
+
+    내려받은 내용이 기존 XML과 같으면(해시 사이드카 비교) 파일을 덮어쓰지 않아
+    수정시각 기반 캐시(.pkl, 프로세스 내 캐시)가 그대로 유지된다.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    data = _http_get(CORP_CODE_ENDPOINT, {"crtfc_key": api_key})
-    with zipfile.ZipFile(BytesIO(data)) as zf:
-        name = zf.namelist()[0]
-        out_path.write_bytes(zf.read(name))
+    digest_path = out_path.with_name(out_path.name + ".blake2")
+    with tempfile.TemporaryDirectory(dir=out_path.parent) as tmp_dir:
+        zip_path = _http_stream(
+            CORP_CODE_ENDPOINT, {"crtfc_key": api_key}, Path(tmp_dir) / "corpCode.zip",
+        )
+        # 압축 해제와 해시 계산을 한 번의 스트림 복사로 처리 (XML을 다시 읽지 않음)
+        extracted = Path(tmp_dir) / out_path.name
+        with zipfile.ZipFile(zip_path) as zf, zf.open(zf.namelist()[0]) as src, \
+                open(extracted, "wb") as dst:
+            new_digest = _copy_with_digest(src, dst)
+        if (
+            out_path.exists()
+            and digest_path.exists()
+            and digest_path.read_text().strip() == new_digest
+        ):
+            return out_path
+        os.replace(extracted, out_path)
+    digest_path.write_text(new_digest + "\n")
+    build_corp_index(out_path)
     return out_path
 
 
-def load_corp_codes(xml_path: Path = CORP_XML_PATH) -> list[dict[str, str]]:
-    """기업코드 XML → [{corp_code, corp_name, stock_code, ...}, ...]"""
-    if not xml_path.exists():
+def _corp_row(node: Any) -> dict[str, str]:
+    """<list> 노드 하나 → {corp_code, corp_name, stock_code, modify_date}"""
+    # findtext를 필드마다 호출하는 대신 자식 노드를 한 번만 순회
+    row = dict.fromkeys(CORP_FIELDS, "")
+    for child in node:
+        if child.tag in row:
+            row[child.tag] = (child.text or "").strip()
+    return row
+
+
+def _index_path(xml_path: Path) -> Path:
+    """XML 옆에 저장되는 파싱 캐시 경로 (corpCode.xml → corpCode.pkl)."""
+    return xml_path.with_suffix(".pkl")
+
+
+def _stock_map_path(xml_path: Path) -> Path:
+    """XML 옆에 저장되는 종목코드 → corp_code 맵 경로 (data/corp_index.json)."""
+    return xml_path.with_name("corp_index.json")
+
+
+def _write_stock_map(xml_path: Path, columns: dict[str, list[str]]) -> dict[str, str]:
+    """상장사 {종목코드: corp_code} 맵을 만들어 JSON으로 저장.
+
+    같은 종목코드가 여러 행이면 XML 순서상 첫 행(find_corp 결과와 동일)을 쓴다.
+    """
+    stock_map: dict[str, str] = {}
+    for sc, cc in zip(columns["stock_code"], columns["corp_code"]):
+        if sc and sc not in stock_map:
+            stock_map[sc] = cc
+    map_path = _stock_map_path(xml_path)
+    tmp_path = map_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(_json_dumps(stock_map))
+        os.replace(tmp_path, map_path)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시 (다음 호출에서 다시 생성)
+    return stock_map
+
+
+def _parse_corp_xml(xml_path: Path) -> list[dict[str, str]]:
+    """기업코드 XML을 스트리밍 파싱하여 행 리스트로 반환."""
+    rows: list[dict[str, str]] = []
+    if _lxml_etree is not None:
+        # libxml2 스트리밍 파싱: <list> 단위로 읽고 처리한 노드는 즉시 해제
+        for _event, node in _lxml_etree.iterparse(
+            str(xml_path), events=("end",), tag="list",
+        ):
+            rows.append(_corp_row(node))
+            node.clear()
+            while node.getprevious() is not None:
+                del node.getparent()[0]
+    else:
+        # 표준 라이브러리 스트리밍 파싱: 처리한 <list>는 비운 뒤 루트에서도 떼어내
+        # 빈 노드 10만여 개가 루트에 쌓이지 않게 한다.
+        root = None
+        for event, node in ET.iterparse(xml_path, events=("start", "end")):
+            if root is None:
+                root = node
+            if event != "end" or node.tag != "list":
+                continue
+            rows.append(_corp_row(node))
+            node.clear()
+            if root is not node:
+                root.clear()
+    return rows
+
+
+def build_corp_index(xml_path: Path = CORP_XML_PATH) -> dict[str, list[str]]:
+    """기업코드 XML을 파싱해 컬럼별 리스트로 변환하고 .pkl 캐시로 저장.
+
+    Returns:
+        {"corp_code": [...], "corp_name": [...], "stock_code": [...],
+         "modify_date": [...], "corp_name_lower": [...]}
+    """
+    rows = _parse_corp_xml(xml_path)
+    columns = {field: [row[field] for row in rows] for field in CORP_FIELDS}
+    columns[CORP_NAME_LOWER] = [name.lower() for name in columns["corp_name"]]
+    index_path = _index_path(xml_path)
+    tmp_path = index_path.with_suffix(".pkl.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(columns, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시 (다음 호출에서 다시 파싱)
+    _write_stock_map(xml_path, columns)
+    return columns
+
+
+def _corp_cache_key(xml_path: Path) -> tuple[str, int]:
+    """프로세스 내 캐시 키 (절대경로, 수정시각). XML이 갱신되면 키가 바뀐다."""
+    try:
+        mtime_ns = xml_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise DartApiError(
             f"{xml_path}에 기업코드 XML이 없습니다. "
             "먼저 download_corp_codes()를 실행하세요."
-        )
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    rows: list[dict[str, str]] = []
-    for node in root.findall("list"):
-        rows.append({
-            "corp_code": (node.findtext("corp_code") or "").strip(),
-            "corp_name": (node.findtext("corp_name") or "").strip(),
-            "stock_code": (node.findtext("stock_code") or "").strip(),
-            "modify_date": (node.findtext("modify_date") or "").strip(),
-        })
-    return rows
+        ) from None
+    return str(xml_path.resolve()), mtime_ns
+
+
+@functools.lru_cache(maxsize=4)
+def _load_corp_columns(path_str: str, mtime_ns: int) -> dict[str, list[str]]:
+    xml_path = Path(path_str)
+    index_path = _index_path(xml_path)
+    try:
+        if index_path.stat().st_mtime_ns >= mtime_ns:
+            with open(index_path, "rb") as f:
+                columns = pickle.load(f)
+            if CORP_NAME_LOWER in columns:
+                return columns
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    return build_corp_index(xml_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _name_search_blob(path_str: str, mtime_ns: int) -> tuple[str, list[int]]:
+    """소문자 기업명을 NUL로 이어 붙인 문자열과 각 행의 시작 오프셋.
+
+    NUL은 XML 값에 나올 수 없으므로 기업명 안의 어떤 문자와도 겹치지 않는다.
+    """
+    names_lower = _load_corp_columns(path_str, mtime_ns)[CORP_NAME_LOWER]
+    blob = "\x00".join(names_lower)
+    starts = [0, *itertools.accumulate(len(v) + 1 for v in names_lower)]
+    return blob, starts
+
+
+@functools.lru_cache(maxsize=4)
+def _stock_index(path_str: str, mtime_ns: int) -> dict[str, tuple[int, ...]]:
+    """종목코드 → 행 번호들 (XML 순서). 비상장사(빈 종목코드)는 제외."""
+    index: dict[str, list[int]] = {}
+    for i, sc in enumerate(_load_corp_columns(path_str, mtime_ns)["stock_code"]):
+        if sc:
+            index.setdefault(sc, []).append(i)
+    return {sc: tuple(rows) for sc, rows in index.items()}
+
+
+@functools.lru_cache(maxsize=4)
+def _name_index(path_str: str, mtime_ns: int) -> dict[str, tuple[int, ...]]:
+    """소문자 기업명(완전 일치) → 행 번호들 (XML 순서)."""
+    index: dict[str, list[int]] = {}
+    for i, name in enumerate(_load_corp_columns(path_str, mtime_ns)[CORP_NAME_LOWER]):
+        if name:
+            index.setdefault(name, []).append(i)
+    return {name: tuple(rows) for name, rows in index.items()}
+
+
+@functools.lru_cache(maxsize=4)
+def _stock_map(path_str: str, mtime_ns: int) -> dict[str, str]:
+    """종목코드 → corp_code. XML보다 새로운 corp_index.json이 있으면 그것만 읽는다.
+
+    상장사 수천 건짜리 작은 JSON이라 10만여 행의 .pkl 인덱스를 통째로
+    읽는 것보다 훨씬 빠르다. 없거나 오래됐으면 인덱스에서 다시 만든다.
+    """
+    xml_path = Path(path_str)
+    map_path = _stock_map_path(xml_path)
+    try:
+        if map_path.stat().st_mtime_ns >= mtime_ns:
+            return _json_loads(map_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return _write_stock_map(xml_path, _load_corp_columns(path_str, mtime_ns))
+
+
+def load_corp_codes_soa(xml_path: Path = CORP_XML_PATH) -> dict[str, list[str]]:
+    """기업코드를 컬럼별 리스트로 반환. XML보다 새로운 .pkl 캐시가 있으면 재사용.
+
+    같은 프로세스 안에서는 (경로, 수정시각) 기준으로 메모리에 캐시되므로
+    반환된 리스트를 직접 수정하지 마세요.
+    """
+    return _load_corp_columns(*_corp_cache_key(xml_path))
+
+
+def load_corp_codes(xml_path: Path = CORP_XML_PATH) -> list[dict[str, str]]:
+    """기업코드 XML → [{corp_code, corp_name, stock_code, ...}, ...]"""
+    columns = load_corp_codes_soa(xml_path)
+    return [
+        dict(zip(CORP_FIELDS, values))
+        for values in zip(*(columns[field] for field in CORP_FIELDS))
+    ]
 
 
 def find_corp(
@@ -119,22 +498,49 @@ def find_corp(
     limit: int = 20,
 ) -> list[dict[str, str]]:
     """기업명 또는 종목코드로 DART corp_code 검색."""
-    rows = load_corp_codes(xml_path)
+    cache_key = _corp_cache_key(xml_path)
+    columns = _load_corp_columns(*cache_key)
     results: list[dict[str, str]] = []
     name_q = (corp_name or "").lower()
     stock_q = (stock_code or "").strip()
+    names_lower = columns[CORP_NAME_LOWER]
 
-    for row in rows:
-        if name_q and name_q not in row["corp_name"].lower():
-            continue
-        if stock_q and stock_q != row["stock_code"]:
-            continue
-        results.append(row)
+    if stock_q:
+        # 종목코드는 사실상 유일하므로 해시 조회로 바로 찾음
+        candidates = (
+            i for i in _stock_index(*cache_key).get(stock_q, ())
+            if not name_q or name_q in names_lower[i]
+        )
+    elif name_q:
+        candidates = _iter_substring(*_name_search_blob(*cache_key), name_q)
+    else:
+        candidates = iter(range(len(names_lower)))
+
+    for i in candidates:
+        results.append({field: columns[field][i] for field in CORP_FIELDS})
         if len(results) >= limit:
             break
     return results
 
 
+def _iter_substring(blob: str, starts: list[int], query: str):
+    """query를 부분 문자열로 포함하는 행 번호를 순서대로 반환.
+
+    blob은 전체 값을 구분자 한 글자로 이어 붙인 문자열, starts는 각 값의 시작 오프셋.
+    str.find로 한 번에 탐색하고 일치 위치는 이진 탐색으로 행 번호로 변환한다.
+    구분자를 넘어 두 행에 걸친 일치는 행 안의 부분 문자열이 아니므로 버린다.
+    """
+    size = len(query)
+    pos = blob.find(query)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        if pos + size < starts[i + 1]:
+            yield i
+            pos = blob.find(query, starts[i + 1])
+        else:
+            pos = blob.find(query, pos + 1)
+
+
 def resolve_corp_code(
     api_key: str,
     corp_code: str | None = None,
@@ -149,12 +555,32 @@ def resolve_corp_code(
     if not xml_path.exists():
         download_corp_codes(api_key, xml_path)
 
-    if stock_code:
+    if not stock_code and not corp_name:
+        raise DartApiError("corp_code, stock_code, corp_name 중 하나를 제공하세요.")
+    return _resolve_cached(stock_code, corp_name, *_corp_cache_key(xml_path))
+
+
+@functools.lru_cache(maxsize=8192)
+def _resolve_cached(
+    stock_code: str | None,
+    corp_name: str | None,
+    path_str: str,
+    mtime_ns: int,
+) -> str:
+    """(stock_code, corp_name) → corp_code. XML이 갱신되면 캐시 키가 바뀐다."""
+    xml_path = Path(path_str)
+    if stock_code and stock_code.strip():
+        # 종목코드만으로 찾을 때는 작은 corp_index.json 맵만 보면 된다
+        found = _stock_map(path_str, mtime_ns).get(stock_code.strip())
+        results = [{"corp_code": found}] if found else []
+    elif stock_code:
         results = find_corp(stock_code=stock_code, xml_path=xml_path, limit=1)
-    elif corp_name:
-        results = find_corp(corp_name=corp_name, xml_path=xml_path, limit=1)
     else:
-        raise DartApiError("corp_code, stock_code, corp_name 중 하나를 제공하세요.")
+        # 기업명이 정확히 일치하는 기업을 해시 조회로 먼저 찾고, 없을 때만 부분 일치 검색
+        exact = _name_index(path_str, mtime_ns).get(corp_name.strip().lower())
+        if exact:
+            return _load_corp_columns(path_str, mtime_ns)["corp_code"][exact[0]]
+        results = find_corp(corp_name=corp_name, xml_path=xml_path, limit=1)
 
     if not results:
         raise DartApiError(
@@ -170,14 +596,34 @@ def fetch_financial_statements(
     bsns_year: str,
     reprt_code: str,
     fs_div: str = "CFS",
+    limiter: TokenBucket | None = None,
+    use_cache: bool = False,
+    force: bool = False,
+    session: requests.Session | None = None,
 ) -> list[dict[str, Any]]:
     """
     OpenDART 전체 재무제표 단일회사 조회.
 
+    use_cache=True면 데이터가 있는 응답을 로컬 캐시(data/cache/)에 저장하고,
+    유효 기간(dart_cache.CACHE_MAX_AGE) 안의 같은 요청은 API를 호출하지 않고
+    캐시에서 반환합니다.
+
+    Args:
+        limiter: 지정하면 API 호출 직전에 limiter.acquire()로 호출 속도를 제한.
+        use_cache: True면 로컬 캐시를 읽고 씀 (기본: 사용 안 함).
+        force: True면 캐시를 읽지 않고 API를 다시 호출 (결과는 캐시에 저장).
+        session: 사용할 HTTP 세션 (기본: 모듈 전역 keep-alive 세션).
+
     Returns:
         list of financial statement items (각 계정과목 한 행).
         빈 리스트이면 데이터 없음.
     """
+    cache_key = (corp_code, bsns_year, reprt_code, fs_div)
+    if use_cache and not force:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return cached
+
     params = {
         "crtfc_key": api_key,
         "corp_code": corp_code,
@@ -185,8 +631,10 @@ def fetch_financial_statements(
         "reprt_code": reprt_code,
         "fs_div": fs_div,
     }
-    data = _http_get(FIN_STMT_ALL_ENDPOINT, params)
-    payload = json.loads(data.decode("utf-8"))
+    if limiter is not None:
+        limiter.acquire()
+    data = _http_get(FIN_STMT_ALL_ENDPOINT, params, session=session)
+    payload = _json_loads(data)
     status = payload.get("status")
     if status == "013":  # 조회된 데이터가 없음
         return []
@@ -194,7 +642,24 @@ def fetch_financial_statements(
         raise DartApiError(
             f"OpenDART 오류 [{status}]: {payload.get('message')}"
         )
-    return payload.get("list", [])
+    items = payload.get("list", [])
+    if use_cache and items:
+        cache_put(cache_key, items)
+    return items
+
+
+# fetch_all_quarters 기본 호출 간격(초). 분당 호출 제한에 여유를 둔 기존 기본값.
+_DEFAULT_DELAY = 0.5
+
+
+@functools.lru_cache(maxsize=4)
+def _delay_limiter(delay: float) -> TokenBucket:
+    """delay 간격에 대응하는 공유 토큰 버킷.
+
+    delay별로 하나만 만들어 fetch_all_quarters를 반복 호출해도 호출 간격이
+    이어지게 하고, 버스트 없이(용량 1) 고정 대기와 같은 간격을 유지한다.
+    """
+    return TokenBucket(1.0 / delay if delay > 0 else 0.0, capacity=1.0)
 
 
 def fetch_all_quarters(
@@ -203,28 +668,57 @@ def fetch_all_quarters(
     year: str,
     fs_div: str = "CFS",
     quarters: list[str] | None = None,
-    delay: float = 0.5,
+    delay: float | None = None,
+    limiter: TokenBucket | None = None,
+    max_workers: int = 4,
+    use_cache: bool = False,
+    force: bool = False,
+    session: requests.Session | None = None,
 ) -> dict[str, list[dict[str, Any]]]:
     """
     지정 연도의 분기별 재무제표를 모두 가져옴.
 
+    분기별 요청을 스레드 풀로 동시에 보내고, 호출 속도는 토큰 버킷으로 제한한다.
+
     Args:
         quarters: ["Q1","H1","Q3","ANNUAL"] 중 원하는 것만 지정. None이면 전부.
-        delay: API 호출 간 대기 시간(초). OpenDART 분당 호출 제한 방지.
+        delay: API 호출 간격(초, 기본 0.5). 같은 delay의 호출끼리는 간격을 공유한다.
+        limiter: 호출 속도 제한기. 지정하면 delay 대신 사용한다.
+        max_workers: 동시 요청 수.
+        use_cache, force, session: fetch_financial_statements에 그대로 전달.
 
     Returns:
-        {"Q1": [...], "H1": [...], ...}
+        {"Q1": [...], "H1": [...], ...}  (quarters 순서 유지)
     """
     if quarters is None:
         quarters = list(REPORT_CODES.keys())
 
-    result: dict[str, list[dict[str, Any]]] = {}
+    codes: list[tuple[str, str]] = []
     for q in quarters:
         code = REPORT_CODES.get(q)
         if not code:
             raise DartApiError(f"잘못된 분기 코드: {q}. 가능한 값: {list(REPORT_CODES.keys())}")
-        items = fetch_financial_statements(api_key, corp_code, year, code, fs_div)
-        result[q] = items
-        if delay > 0:
-            time.sleep(delay)
-    return result
+        codes.append((q, code))
+
+    if limiter is None:
+        limiter = _delay_limiter(_DEFAULT_DELAY if delay is None else delay)
+    elif delay is not None:
+        warnings.warn(
+            "limiter가 지정되어 delay는 무시됩니다.",
+            UserWarning,
+            stacklevel=2,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(codes) or 1))) as executor:
+        futures = {
+            q: executor.submit(
+                fetch_financial_statements, api_key, corp_code, year, code, fs_div,
+                limiter=limiter, use_cache=use_cache, force=force, session=session,
+            )
+            for q, code in codes
+        }
+        try:
+            return {q: future.result() for q, future in futures.items()}
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
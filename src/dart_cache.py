@@ -0,0 +1,95 @@
+"""OpenDART 재무제표 응답 로컬 캐시 (sqlite).
+
+키   – (corp_code, bsns_year, reprt_code, fs_div)
+값   – 응답의 "list" (JSON → zlib 압축 BLOB)
+위치 – data/cache/dart_fs.sqlite3
+
+데이터가 있는 응답(status 000)만 저장합니다. "조회된 데이터 없음"(013)은
+나중에 공시가 올라올 수 있으므로 캐시하지 않습니다. 정정공시가 반영되도록
+저장 후 CACHE_MAX_AGE가 지난 항목은 캐시 미스로 처리합니다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from .jsonio import dumps as _json_dumps, loads as _json_loads
+
+# ── 기본 경로 ─────────────────────────────────────────────────
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+CACHE_PATH = DATA_DIR / "cache" / "dart_fs.sqlite3"
+
+CacheKey = tuple[str, str, str, str]  # (corp_code, bsns_year, reprt_code, fs_div)
+
+# 캐시 유효 기간(초). 이보다 오래된 항목은 API를 다시 호출해 갱신한다.
+CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# 수집 스레드들이 하나의 커넥션을 공유하므로 접근은 락으로 직렬화
+_LOCK = threading.Lock()
+_CONNECTIONS: dict[Path, sqlite3.Connection] = {}
+
+
+def _connect(path: Path | None) -> sqlite3.Connection:
+    path = path or CACHE_PATH
+    conn = _CONNECTIONS.get(path)
+    if conn is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fs_cache ("
+            " k TEXT PRIMARY KEY, v BLOB NOT NULL, fetched_at INTEGER NOT NULL)"
+        )
+        _CONNECTIONS[path] = conn
+    return conn
+
+
+def _key_str(key: CacheKey) -> str:
+    return "|".join(key)
+
+
+def cache_get(
+    key: CacheKey,
+    path: Path | None = None,
+    max_age: float | None = CACHE_MAX_AGE,
+) -> list[dict[str, Any]] | None:
+    """캐시된 재무제표 항목 리스트를 반환.
+
+    없거나 max_age(초)보다 오래됐으면 None. 손상되어 읽을 수 없는 항목은
+    삭제하고 None을 반환한다. max_age=None이면 만료를 검사하지 않는다.
+    """
+    k = _key_str(key)
+    with _LOCK:
+        row = _connect(path).execute(
+            "SELECT v, fetched_at FROM fs_cache WHERE k = ?", (k,)
+        ).fetchone()
+    if row is None:
+        return None
+    blob, fetched_at = row
+    if max_age is not None and time.time() - fetched_at > max_age:
+        return None
+    try:
+        return _json_loads(zlib.decompress(blob))
+    except (zlib.error, ValueError):
+        with _LOCK:
+            _connect(path).execute("DELETE FROM fs_cache WHERE k = ?", (k,))
+        return None
+
+
+def cache_put(
+    key: CacheKey,
+    payload: list[dict[str, Any]],
+    path: Path | None = None,
+) -> None:
+    """재무제표 항목 리스트를 캐시에 저장 (같은 키는 덮어씀)."""
+    blob = zlib.compress(_json_dumps(payload), 6)
+    with _LOCK:
+        _connect(path).execute(
+            "INSERT OR REPLACE INTO fs_cache (k, v, fetched_at) VALUES (?, ?, ?)",
+            (_key_str(key), blob, int(time.time())),
+        )
@@ -0,0 +1,40 @@
+"""프로젝트 루트 .env 파일 읽기 (dart_api, s3_uploader 공용).
+
+.env는 (경로, 수정시각) 기준으로 한 번만 파싱해 캐시하므로, 배치 수집 중
+여러 번 호출해도 파일을 다시 열지 않습니다. 파일이 바뀌면 자동으로 다시 읽습니다.
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+
+def load_env(path: Path | None = None) -> dict[str, str]:
+    """.env 파일의 KEY=VALUE 목록을 dict로 반환. 파일이 없으면 빈 dict.
+
+    캐시된 dict를 그대로 반환하므로 수정하지 마세요.
+    """
+    path = path if path is not None else ENV_PATH
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return _parse_env_file(str(path.resolve()), mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(path_str: str, mtime_ns: int) -> dict[str, str]:
+    """(경로, 수정시각) 기준 캐시 – .env가 바뀌지 않으면 다시 읽지 않음."""
+    env: dict[str, str] = {}
+    for line in Path(path_str).read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        env[key.strip()] = value.strip().strip('"').strip("'")
+    return env
@@ -0,0 +1,31 @@
+"""JSON 직렬화 헬퍼.
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 폴백한다.
+두 경우 모두 UTF-8 bytes를 주고받으며 한글은 이스케이프하지 않는다.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """JSON bytes/str → Python 객체."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Python 객체 → 공백 없는 compact 형식의 UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -13,7 +13,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 # 타입 별칭
 Items = dict[str, dict[str, float | None]]  # account_mapper 결과
@@ -40,257 +40,369 @@ def _pct(numerator: float | None, denominator: float | None) -> float | None:
     return val * 100 if val is not None else None
 
 
-def _growth(current: float | None, previous: float | None) -> float | None:
-    """증가율(%) = (당기 - 전기) / 전기 * 100."""
-    if current is None or previous is None or previous == 0:
+# ═══════════════════════════════════════════════════════════════
+# 비율 연산자
+# ═══════════════════════════════════════════════════════════════
+# 스펙 테이블의 op 이름 → 계산 함수. _get/_safe_div 호출을 풀어 써서
+# 비율 하나당 파이썬 함수 호출을 1번으로 줄인다. 가변 인자(*args) 호출은
+# 일반 호출보다 느리므로 모든 연산자를 (items, a, b) 고정 인자로 맞춘다.
+
+_EMPTY: dict[str, float | None] = {}
+
+
+def _op_growth(items: Items, key: str, _unused: None = None) -> float | None:
+    """(당기 - 전기) / 전기 * 100."""
+    entry = items.get(key) or _EMPTY
+    cur = entry.get("thstrm")
+    prev = entry.get("frmtrm")
+    if cur is None or prev is None or prev == 0:
+        return None
+    return (cur - prev) / prev * 100
+
+
+def _op_div(items: Items, num_key: str, den_key: str) -> float | None:
+    """분자 / 분모."""
+    num = (items.get(num_key) or _EMPTY).get("thstrm")
+    den = (items.get(den_key) or _EMPTY).get("thstrm")
+    if num is None or den is None or den == 0:
+        return None
+    return num / den
+
+
+def _op_pct(items: Items, num_key: str, den_key: str) -> float | None:
+    """분자 / 분모 * 100."""
+    num = (items.get(num_key) or _EMPTY).get("thstrm")
+    den = (items.get(den_key) or _EMPTY).get("thstrm")
+    if num is None or den is None or den == 0:
+        return None
+    return num / den * 100
+
+
+def _op_sum_pct(items: Items, keys: tuple[str, ...], den_key: str) -> float | None:
+    """합계 / 분모 * 100. 합계 항목의 None은 0으로 본다."""
+    den = (items.get(den_key) or _EMPTY).get("thstrm")
+    if den is None or den == 0:
+        return None
+    total = 0
+    for k in keys:
+        total += (items.get(k) or _EMPTY).get("thstrm") or 0
+    return total / den * 100
+
+
+def _op_sum(items: Items, keys: tuple[str, ...], _unused: None = None) -> float | None:
+    """항목 합계. 모든 항목이 None이면 None."""
+    total = 0
+    found = False
+    for k in keys:
+        v = (items.get(k) or _EMPTY).get("thstrm")
+        if v is not None:
+            found = True
+        total += v or 0
+    return total if found else None
+
+
+def _op_value(items: Items, key: str, _unused: None = None) -> float | None:
+    """항목 절대값."""
+    return (items.get(key) or _EMPTY).get("thstrm")
+
+
+def _op_deriv(
+    items: Items, func: Callable[[Items], float | None], _unused: None = None
+) -> float | None:
+    """위 연산자로 표현되지 않는 비율은 전용 함수로 계산."""
+    return func(items)
+
+
+_OPS: dict[str, Callable[..., float | None]] = {
+    "growth": _op_growth,
+    "div": _op_div,
+    "pct": _op_pct,
+    "sum_pct": _op_sum_pct,
+    "sum": _op_sum,
+    "value": _op_value,
+    "deriv": _op_deriv,
+}
+
+
+# ── deriv 전용 계산 함수 ──────────────────────────────────────
+def _quick_ratio(items: Items) -> float | None:
+    """당좌자산 / 유동부채 * 100.  당좌자산 = 유동자산 - 재고자산."""
+    ca = _get(items, "current_assets")
+    if ca is None:
         return None
-    return (current - previous) / previous * 100
+    inv = _get(items, "inventories") or 0
+    return _pct(ca - inv, _get(items, "current_liabilities"))
+
+
+def _net_working_capital_ratio(items: Items) -> float | None:
+    """(유동자산 - 유동부채) / 자산총계 * 100."""
+    ca = _get(items, "current_assets")
+    cl = _get(items, "current_liabilities")
+    if ca is None or cl is None:
+        return None
+    return _pct(ca - cl, _get(items, "total_assets"))
+
+
+def _reserve_ratio(items: Items) -> float | None:
+    """(이익잉여금 + 자본잉여금) / 납입자본금 * 100. 이익잉여금이 없으면 None."""
+    re_ = _get(items, "retained_earnings")
+    if re_ is None:
+        return None
+    reserves = (re_ or 0) + (_get(items, "capital_surplus") or 0)
+    return _pct(reserves, _get(items, "paid_in_capital"))
+
+
+def _investment_efficiency(items: Items) -> float | None:
+    """(당기순이익 + 이자비용) / 자산총계. 당기순이익이 없으면 None."""
+    ni = _get(items, "net_income")
+    if ni is None:
+        return None
+    ie = _get(items, "interest_expense") or 0
+    return _safe_div(ni + ie, _get(items, "total_assets"))
+
+
+# ═══════════════════════════════════════════════════════════════
+# 비율 스펙 테이블
+# ═══════════════════════════════════════════════════════════════
+# (카테고리, 비율명, op, *인자). 기간을 따로 적지 않은 항목은 당기(thstrm) 값,
+# growth는 당기와 전기(frmtrm)를 비교한다. 총자본 = 자산총계.
+
+RATIO_SPECS: list[tuple[Any, ...]] = [
+    # 성장성
+    ("성장성", "총자산증가율",       "growth", "total_assets"),
+    ("성장성", "유동자산증가율",     "growth", "current_assets"),
+    ("성장성", "매출액증가율",       "growth", "revenue"),
+    ("성장성", "순이익증가율",       "growth", "net_income"),
+    ("성장성", "영업이익증가율",     "growth", "operating_income"),
+    # 수익성
+    ("수익성", "매출액순이익률",     "pct", "net_income", "revenue"),
+    ("수익성", "매출총이익률",       "pct", "gross_profit", "revenue"),
+    ("수익성", "자기자본순이익률",   "pct", "net_income", "total_equity"),
+    # 활동성
+    ("활동성", "매출채권회전율",     "div", "revenue", "trade_receivables"),
+    ("활동성", "재고자산회전율",     "div", "cost_of_sales", "inventories"),
+    ("활동성", "총자본회전율",       "div", "revenue", "total_assets"),
+    ("활동성", "유형자산회전율",     "div", "revenue", "total_assets"),  # 이미지 기준: 매출액/총자산
+    ("활동성", "매출원가율",         "pct", "cost_of_sales", "revenue"),
+    # 안정성
+    ("안정성", "부채비율",           "pct", "total_liabilities", "total_equity"),
+    ("안정성", "유동비율",           "pct", "current_assets", "current_liabilities"),
+    ("안정성", "자기자본비율",       "pct", "total_equity", "total_assets"),
+    ("안정성", "당좌비율",           "deriv", _quick_ratio),
+    ("안정성", "비유동자산장기적합률", "div", "non_current_assets", "long_term_borrowings"),
+    ("안정성", "순운전자본비율",     "deriv", _net_working_capital_ratio),
+    ("안정성", "차입금의존도",       "sum_pct",
+     ("short_term_borrowings", "long_term_borrowings", "bonds_payable"), "total_assets"),
+    ("안정성", "현금비율",           "pct", "cash", "current_liabilities"),
+    ("안정성", "유형자산",           "value", "tangible_assets"),
+    ("안정성", "무형자산",           "value", "intangible_assets"),
+    ("안정성", "무형자산상각비",     "value", "amortization"),
+    ("안정성", "유형자산상각비",     "value", "depreciation"),
+    ("안정성", "감가상각비",         "sum", ("depreciation", "amortization")),
+    # 가치평가
+    ("가치평가", "총자본영업이익률", "pct", "operating_income", "total_assets"),
+    ("가치평가", "총자본순이익률",   "pct", "net_income", "total_assets"),
+    ("가치평가", "유보액/납입자본비율", "deriv", _reserve_ratio),
+    ("가치평가", "총자본투자효율",   "deriv", _investment_efficiency),
+]
+
+# CSV 컬럼 순서에 쓸 비율명 리스트
+RATIO_NAMES: list[str] = [spec[1] for spec in RATIO_SPECS]
+
+# compute_all_ratios 루프용: (비율명, 연산 함수, 인자 a, 인자 b)
+_COMPILED_SPECS: list[tuple[str, Callable[..., float | None], Any, Any]] = [
+    (spec[1], _OPS[spec[2]], spec[3], spec[4] if len(spec) > 4 else None)
+    for spec in RATIO_SPECS
+]
+_SPEC_BY_NAME: dict[str, tuple[Callable[..., float | None], Any, Any]] = {
+    name: (op, a, b) for name, op, a, b in _COMPILED_SPECS
+}
+
+
+def _ratio(name: str, items: Items) -> float | None:
+    """비율명 하나를 스펙 테이블대로 계산."""
+    op, a, b = _SPEC_BY_NAME[name]
+    return op(items, a, b)
 
 
 # ═══════════════════════════════════════════════════════════════
-# 개별 비율 계산 함수
+# 개별 비율 계산 함수 (하위 호환용 — 스펙 테이블에 위임)
 # ═══════════════════════════════════════════════════════════════
 
 # ── 성장성 ────────────────────────────────────────────────────
 def 총자산증가율(items: Items) -> float | None:
     """(기말총자산 - 기초총자산) / 기초총자산 * 100.
     기말 = thstrm, 기초 = frmtrm (BS 항목의 전기 잔액 = 당기 기초)."""
-    return _growth(_get(items, "total_assets", "thstrm"),
-                   _get(items, "total_assets", "frmtrm"))
+    return _ratio("총자산증가율", items)
 
 
 def 유동자산증가율(items: Items) -> float | None:
-    return _growth(_get(items, "current_assets", "thstrm"),
-                   _get(items, "current_assets", "frmtrm"))
+    return _ratio("유동자산증가율", items)
 
 
 def 매출액증가율(items: Items) -> float | None:
     """(당기매출액 - 전기매출액) / 전기매출액 * 100."""
-    return _growth(_get(items, "revenue", "thstrm"),
-                   _get(items, "revenue", "frmtrm"))
+    return _ratio("매출액증가율", items)
 
 
 def 순이익증가율(items: Items) -> float | None:
-    return _growth(_get(items, "net_income", "thstrm"),
-                   _get(items, "net_income", "frmtrm"))
+    return _ratio("순이익증가율", items)
 
 
 def 영업이익증가율(items: Items) -> float | None:
-    return _growth(_get(items, "operating_income", "thstrm"),
-                   _get(items, "operating_income", "frmtrm"))
+    return _ratio("영업이익증가율", items)
 
 
 # ── 수익성 ────────────────────────────────────────────────────
 def 매출액순이익률(items: Items) -> float | None:
     """순이익 / 매출액 * 100."""
-    return _pct(_get(items, "net_income"), _get(items, "revenue"))
+    return _ratio("매출액순이익률", items)
 
 
 def 매출총이익률(items: Items) -> float | None:
     """매출총이익 / 매출액 * 100."""
-    return _pct(_get(items, "gross_profit"), _get(items, "revenue"))
+    return _ratio("매출총이익률", items)
 
 
 def 자기자본순이익률(items: Items) -> float | None:
     """순이익 / 자기자본 * 100  (ROE)."""
-    return _pct(_get(items, "net_income"), _get(items, "total_equity"))
+    return _ratio("자기자본순이익률", items)
 
 
 # ── 활동성 ────────────────────────────────────────────────────
 def 매출채권회전율(items: Items) -> float | None:
     """매출액 / 매출채권."""
-    return _safe_div(_get(items, "revenue"), _get(items, "trade_receivables"))
+    return _ratio("매출채권회전율", items)
 
 
 def 재고자산회전율(items: Items) -> float | None:
     """매출원가 / 재고자산."""
-    return _safe_div(_get(items, "cost_of_sales"), _get(items, "inventories"))
+    return _ratio("재고자산회전율", items)
 
 
 def 총자본회전율(items: Items) -> float | None:
     """매출액 / 총자본 (= 자산총계)."""
-    return _safe_div(_get(items, "revenue"), _get(items, "total_assets"))
+    return _ratio("총자본회전율", items)
 
 
 def 유형자산회전율(items: Items) -> float | None:
     """매출액 / 총자산 (이미지 기준: 매출액/총자산)."""
-    return _safe_div(_get(items, "revenue"), _get(items, "total_assets"))
+    return _ratio("유형자산회전율", items)
 
 
 def 매출원가율(items: Items) -> float | None:
     """매출원가 / 매출액 * 100."""
-    return _pct(_get(items, "cost_of_sales"), _get(items, "revenue"))
+    return _ratio("매출원가율", items)
 
 
 # ── 안정성 ────────────────────────────────────────────────────
 def 부채비율(items: Items) -> float | None:
     """부채 / 자기자본 * 100."""
-    return _pct(_get(items, "total_liabilities"), _get(items, "total_equity"))
+    return _ratio("부채비율", items)
 
 
 def 유동비율(items: Items) -> float | None:
     """유동자산 / 유동부채 * 100."""
-    return _pct(_get(items, "current_assets"), _get(items, "current_liabilities"))
+    return _ratio("유동비율", items)
 
 
 def 자기자본비율(items: Items) -> float | None:
     """자기자본 / 총자산 * 100."""
-    return _pct(_get(items, "total_equity"), _get(items, "total_assets"))
+    return _ratio("자기자본비율", items)
 
 
 def 당좌비율(items: Items) -> float | None:
     """당좌자산 / 유동부채 * 100.
     당좌자산 = 유동자산 - 재고자산."""
-    ca = _get(items, "current_assets")
-    inv = _get(items, "inventories") or 0
-    cl = _get(items, "current_liabilities")
-    if ca is None:
-        return None
-    quick = ca - inv
-    return _pct(quick, cl)
+    return _ratio("당좌비율", items)
 
 
 def 비유동자산장기적합률(items: Items) -> float | None:
     """비유동자산 / 장기차입금."""
-    return _safe_div(_get(items, "non_current_assets"),
-                     _get(items, "long_term_borrowings"))
+    return _ratio("비유동자산장기적합률", items)
 
 
 def 순운전자본비율(items: Items) -> float | None:
     """순운전자본 / 총자본 * 100.
     순운전자본 = 유동자산 - 유동부채, 총자본 = 자산총계."""
-    ca = _get(items, "current_assets")
-    cl = _get(items, "current_liabilities")
-    ta = _get(items, "total_assets")
-    if ca is None or cl is None:
-        return None
-    nwc = ca - cl
-    return _pct(nwc, ta)
+    return _ratio("순운전자본비율", items)
 
 
 def 차입금의존도(items: Items) -> float | None:
     """(장기+단기차입금+사채) / 총자본 * 100."""
-    stb = _get(items, "short_term_borrowings") or 0
-    ltb = _get(items, "long_term_borrowings") or 0
-    bonds = _get(items, "bonds_payable") or 0
-    ta = _get(items, "total_assets")
-    total_borrowing = stb + ltb + bonds
-    return _pct(total_borrowing, ta)
+    return _ratio("차입금의존도", items)
 
 
 def 현금비율(items: Items) -> float | None:
     """현금예금 / 유동부채 * 100."""
-    return _pct(_get(items, "cash"), _get(items, "current_liabilities"))
+    return _ratio("현금비율", items)
 
 
 def 유형자산_값(items: Items) -> float | None:
     """유형자산 절대값."""
-    return _get(items, "tangible_assets")
+    return _ratio("유형자산", items)
 
 
 def 무형자산_값(items: Items) -> float | None:
     """무형자산 절대값."""
-    return _get(items, "intangible_assets")
+    return _ratio("무형자산", items)
 
 
 def 무형자산상각비_값(items: Items) -> float | None:
     """무형자산상각비 (CF에서 추출)."""
-    return _get(items, "amortization")
+    return _ratio("무형자산상각비", items)
 
 
 def 유형자산상각비_값(items: Items) -> float | None:
     """유형자산감가상각비 (CF에서 추출)."""
-    return _get(items, "depreciation")
+    return _ratio("유형자산상각비", items)
 
 
 def 감가상각비(items: Items) -> float | None:
     """유형자산상각비 + 무형자산상각비."""
-    dep = _get(items, "depreciation") or 0
-    amo = _get(items, "amortization") or 0
-    if _get(items, "depreciation") is None and _get(items, "amortization") is None:
-        return None
-    return dep + amo
+    return _ratio("감가상각비", items)
 
 
 # ── 가치평가 ──────────────────────────────────────────────────
 def 총자본영업이익률(items: Items) -> float | None:
     """영업이익 / 총자본 * 100."""
-    return _pct(_get(items, "operating_income"), _get(items, "total_assets"))
+    return _ratio("총자본영업이익률", items)
 
 
 def 총자본순이익률(items: Items) -> float | None:
     """당기순이익 / 총자본 * 100."""
-    return _pct(_get(items, "net_income"), _get(items, "total_assets"))
+    return _ratio("총자본순이익률", items)
 
 
 def 유보액_납입자본비율(items: Items) -> float | None:
     """유보액 / 납입자본금 * 100.
     유보액 ≈ 이익잉여금 + 자본잉여금."""
-    re_ = _get(items, "retained_earnings") or 0
-    cs = _get(items, "capital_surplus") or 0
-    pic = _get(items, "paid_in_capital")
-    if _get(items, "retained_earnings") is None:
-        return None
-    reserves = re_ + cs
-    return _pct(reserves, pic)
+    return _ratio("유보액/납입자본비율", items)
 
 
 def 총자본투자효율(items: Items) -> float | None:
     """(당기순이익 + 이자비용) / 총자본."""
-    ni = _get(items, "net_income")
-    ie = _get(items, "interest_expense") or 0
-    ta = _get(items, "total_assets")
-    if ni is None:
-        return None
-    return _safe_div(ni + ie, ta)
-
+    return _ratio("총자본투자효율", items)
 
-# ═══════════════════════════════════════════════════════════════
-# 전체 비율 계산 오케스트레이션
-# ═══════════════════════════════════════════════════════════════
 
-# (카테고리, 비율명, 계산함수) 순서 리스트
+# (카테고리, 비율명, 계산함수) 순서 리스트 — 기존 호출부 호환용
 RATIO_DEFINITIONS: list[tuple[str, str, Any]] = [
-    # 성장성
-    ("성장성", "총자산증가율",       총자산증가율),
-    ("성장성", "유동자산증가율",     유동자산증가율),
-    ("성장성", "매출액증가율",       매출액증가율),
-    ("성장성", "순이익증가율",       순이익증가율),
-    ("성장성", "영업이익증가율",     영업이익증가율),
-    # 수익성
-    ("수익성", "매출액순이익률",     매출액순이익률),
-    ("수익성", "매출총이익률",       매출총이익률),
-    ("수익성", "자기자본순이익률",   자기자본순이익률),
-    # 활동성
-    ("활동성", "매출채권회전율",     매출채권회전율),
-    ("활동성", "재고자산회전율",     재고자산회전율),
-    ("활동성", "총자본회전율",       총자본회전율),
-    ("활동성", "유형자산회전율",     유형자산회전율),
-    ("활동성", "매출원가율",         매출원가율),
-    # 안정성
-    ("안정성", "부채비율",           부채비율),
-    ("안정성", "유동비율",           유동비율),
-    ("안정성", "자기자본비율",       자기자본비율),
-    ("안정성", "당좌비율",           당좌비율),
-    ("안정성", "비유동자산장기적합률", 비유동자산장기적합률),
-    ("안정성", "순운전자본비율",     순운전자본비율),
-    ("안정성", "차입금의존도",       차입금의존도),
-    ("안정성", "현금비율",           현금비율),
-    ("안정성", "유형자산",           유형자산_값),
-    ("안정성", "무형자산",           무형자산_값),
-    ("안정성", "무형자산상각비",     무형자산상각비_값),
-    ("안정성", "유형자산상각비",     유형자산상각비_값),
-    ("안정성", "감가상각비",         감가상각비),
-    # 가치평가
-    ("가치평가", "총자본영업이익률", 총자본영업이익률),
-    ("가치평가", "총자본순이익률",   총자본순이익률),
-    ("가치평가", "유보액/납입자본비율", 유보액_납입자본비율),
-    ("가치평가", "총자본투자효율",   총자본투자효율),
+    (cat, name, func)
+    for (cat, name, *_), func in zip(RATIO_SPECS, [
+        총자산증가율, 유동자산증가율, 매출액증가율, 순이익증가율, 영업이익증가율,
+        매출액순이익률, 매출총이익률, 자기자본순이익률,
+        매출채권회전율, 재고자산회전율, 총자본회전율, 유형자산회전율, 매출원가율,
+        부채비율, 유동비율, 자기자본비율, 당좌비율, 비유동자산장기적합률,
+        순운전자본비율, 차입금의존도, 현금비율,
+        유형자산_값, 무형자산_값, 무형자산상각비_값, 유형자산상각비_값, 감가상각비,
+        총자본영업이익률, 총자본순이익률, 유보액_납입자본비율, 총자본투자효율,
+    ])
 ]
 
-# CSV 컬럼 순서에 쓸 비율명 리스트
-RATIO_NAMES: list[str] = [name for _, name, _ in RATIO_DEFINITIONS]
 
+# ═══════════════════════════════════════════════════════════════
+# 전체 비율 계산 오케스트레이션
+# ═══════════════════════════════════════════════════════════════
 
 def compute_all_ratios(items: Items) -> dict[str, float | None]:
     """
@@ -299,10 +411,15 @@ def compute_all_ratios(items: Items) -> dict[str, float | None]:
     Returns:
         {"총자산증가율": 12.34, "유동자산증가율": None, ...}
     """
+    try:
+        return {name: op(items, a, b) for name, op, a, b in _COMPILED_SPECS}
+    except Exception:
+        pass
+    # 숫자가 아닌 값 등으로 실패한 비율만 None 처리
     result: dict[str, float | None] = {}
-    for _cat, name, func in RATIO_DEFINITIONS:
+    for name, op, a, b in _COMPILED_SPECS:
         try:
-            result[name] = func(items)
+            result[name] = op(items, a, b)
         except Exception:
             result[name] = None
     return result
@@ -4,10 +4,14 @@ S3 디렉터리 구조
 ─────────────────
 s3://{bucket}/
   └── {gics_sector}/
-      ├── 019440_2023_Q1.json
-      ├── 019440_2023_H1.json
-      ├── 019440_2023_Q3.json
-      └── 019440_2023_ANNUAL.json
+      ├── 019440_2023_Q1.json.gz
+      ├── 019440_2023_H1.json.gz
+      ├── 019440_2023_Q3.json.gz
+      └── 019440_2023_ANNUAL.json.gz
+
+객체 본문은 gzip으로 압축한 compact JSON이다 (로컬 --save-raw의 .json.gz와 같은 형식).
+압축 여부가 key 확장자에 드러나도록 .json.gz key를 쓰고 Content-Encoding은 붙이지 않으므로,
+boto3 get_object 등 어떤 클라이언트로 받아도 gzip 바이트 그대로 받는다.
 
 필요한 환경변수 (.env)
 ─────────────────────
@@ -19,36 +23,26 @@ s3://{bucket}/
 
 from __future__ import annotations
 
-import json
+import gzip
 import os
 import sys
-from pathlib import Path
-from typing import Any
-
-
-def _load_env() -> dict[str, str]:
-    """프로젝트 루트의 .env 파일에서 환경변수 읽기."""
-    env: dict[str, str] = {}
-    env_path = Path(__file__).resolve().parent.parent / ".env"
-    if not env_path.exists():
-        return env
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        env[key.strip()] = value.strip().strip('"').strip("'")
-    return env
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Iterable
+
+from .env import load_env
+from .jsonio import dumps as _json_dumps
 
 
+@lru_cache(maxsize=4)
 def _get_s3_config(
     bucket: str | None = None,
     region: str | None = None,
 ) -> dict[str, str]:
-    """S3 접속 정보를 환경변수 + .env에서 가져옴."""
-    env = _load_env()
+    """S3 접속 정보를 환경변수 + .env에서 가져옴. (bucket, region)별로 캐시."""
+    env = load_env()
 
     access_key = os.getenv("S3_ACCESS_KEY") or env.get("S3_ACCESS_KEY")
     secret_key = os.getenv("S3_PRIVATE_KEY") or env.get("S3_PRIVATE_KEY")
@@ -72,10 +66,27 @@ def _get_s3_config(
     }
 
 
-def _get_s3_client(config: dict[str, str]):
-    """boto3 S3 클라이언트 생성."""
+def _get_s3_client(config: dict[str, str], max_pool_connections: int = 32):
+    """boto3 S3 클라이언트 반환.
+
+    클라이언트는 스레드 간에 공유해도 안전하므로 같은 인증 정보·리전이면
+    프로세스 전체에서 하나를 재사용한다. 동시 업로드 스레드 수만큼
+    HTTP 연결을 재사용할 수 있도록 max_pool_connections를 늘려 둔다.
+    """
+    return _build_s3_client(
+        config["access_key"], config["secret_key"], config["region"],
+        max_pool_connections,
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_s3_client(
+    access_key: str, secret_key: str, region: str, max_pool_connections: int
+):
+    """boto3 S3 클라이언트 생성 (botocore 세션 생성 비용이 커서 캐시)."""
     try:
         import boto3
+        from botocore.config import Config
     except ImportError:
         raise RuntimeError(
             "boto3가 설치되어 있지 않습니다. pip install boto3 를 실행하세요."
@@ -83,12 +94,27 @@ def _get_s3_client(config: dict[str, str]):
 
     return boto3.client(
         "s3",
-        aws_access_key_id=config["access_key"],
-        aws_secret_access_key=config["secret_key"],
-        region_name=config["region"],
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=Config(max_pool_connections=max_pool_connections),
     )
 
 
+def check_s3_access(bucket: str | None = None, region: str | None = None) -> str:
+    """S3 설정과 클라이언트를 미리 준비해 업로드 전에 오류를 드러낸다.
+
+    인증 키·버킷 이름이 없거나 boto3가 없으면 RuntimeError를 올린다.
+    수집을 시작하기 전에 호출하면 긴 수집이 끝난 뒤에야 실패하는 일을 막는다.
+
+    Returns:
+        업로드 대상 버킷 이름
+    """
+    config = _get_s3_config(bucket, region)
+    _get_s3_client(config)
+    return config["bucket"]
+
+
 def _try_create_bucket(client, bucket: str, region: str) -> None:
     """버킷이 없을 때 생성을 시도합니다.
 
@@ -131,6 +157,43 @@ def _check_s3_exists(client, bucket: str, key: str) -> bool:
         return False
 
 
+# 버킷 자동 생성은 동시 업로드 스레드 중 하나만 수행
+_BUCKET_LOCK = threading.Lock()
+
+
+def _s3_key(gics_sector: str, stock_code: str, year: str, quarter: str) -> str:
+    """S3 key: {gics_sector}/{stock_code}_{year}_{quarter}.json.gz"""
+    return f"{gics_sector}/{stock_code}_{year}_{quarter}.json.gz"
+
+
+def _put_json(client, config: dict[str, str], s3_key: str, body: bytes) -> None:
+    """JSON body 1건을 gzip 압축해 업로드. 버킷이 없으면 생성 후 한 번 재시도.
+
+    재무제표 JSON은 반복이 많아 압축률이 높다. 압축(zlib)은 GIL을 놓으므로
+    배치 업로드 스레드에서 병렬로 수행된다. 로컬 --save-raw와 같은 설정을 쓴다.
+    """
+    body = gzip.compress(body, compresslevel=6, mtime=0)
+
+    def _put() -> None:
+        client.put_object(
+            Bucket=config["bucket"], Key=s3_key, Body=body,
+            ContentType="application/gzip",
+        )
+
+    try:
+        _put()
+        return
+    except client.exceptions.NoSuchBucket:
+        pass
+    with _BUCKET_LOCK:
+        try:
+            _put()  # 다른 스레드가 먼저 버킷을 만들었으면 여기서 성공
+            return
+        except client.exceptions.NoSuchBucket:
+            _try_create_bucket(client, config["bucket"], config["region"])
+    _put()  # 버킷 생성 후에도 없으면 예외 그대로 전파
+
+
 def upload_raw_to_s3(
     raw_items: list[dict[str, Any]],
     stock_code: str,
@@ -141,9 +204,9 @@ def upload_raw_to_s3(
     region: str | None = None,
 ) -> str:
     """
-    원본 재무제표 JSON 1건을 S3에 업로드.
+    원본 재무제표 JSON 1건을 gzip 압축해 S3에 업로드.
 
-    S3 Key: {gics_sector}/{stock_code}_{year}_{quarter}.json
+    S3 Key: {gics_sector}/{stock_code}_{year}_{quarter}.json.gz
 
     Args:
         raw_items: DART에서 받은 원시 재무제표 데이터
@@ -160,35 +223,28 @@ def upload_raw_to_s3(
     config = _get_s3_config(bucket, region)
     client = _get_s3_client(config)
 
-    # S3 key 생성: {gics_sector}/{stock_code}_{year}_{quarter}.json
-    s3_key = f"{gics_sector}/{stock_code}_{year}_{quarter}.json"
-    body = json.dumps(raw_items, ensure_ascii=False, indent=2).encode("utf-8")
+    s3_key = _s3_key(gics_sector, stock_code, year, quarter)
+    body = _json_dumps(raw_items)
 
     # 업로드 시도 → NoSuchBucket이면 버킷 생성 후 재시도
-    try:
-        client.put_object(
-            Bucket=config["bucket"], Key=s3_key, Body=body,
-            ContentType="application/json; charset=utf-8",
-        )
-    except client.exceptions.NoSuchBucket:
-        _try_create_bucket(client, config["bucket"], config["region"])
-        client.put_object(
-            Bucket=config["bucket"], Key=s3_key, Body=body,
-            ContentType="application/json; charset=utf-8",
-        )
+    _put_json(client, config, s3_key, body)
 
     return f"s3://{config['bucket']}/{s3_key}"
 
 
 def upload_batch_to_s3(
-    raw_data_list: list[dict[str, Any]],
+    raw_data_list: Iterable[dict[str, Any]],
     bucket: str | None = None,
     region: str | None = None,
     force: bool = False,
+    max_workers: int = 16,
 ) -> list[str]:
     """
     여러 건의 원본 재무제표를 S3에 배치 업로드.
     이미 S3에 존재하는 파일은 건너뛰고, force=True면 덮어씁니다.
+    raw_data_list는 리스트뿐 아니라 제너레이터도 받으므로, 수집 중인
+    항목을 큐에서 꺼내며 바로 업로드할 수 있습니다.
+    업로드는 max_workers개 스레드가 하나의 S3 클라이언트를 공유하며 동시에 수행합니다.
 
     Args:
         raw_data_list: [
@@ -202,57 +258,60 @@ def upload_batch_to_s3(
             ...
         ]
         force: True면 기존 파일 덮어쓰기
+        max_workers: 동시 업로드 스레드 수
 
     Returns:
-        업로드된 S3 key 리스트
+        업로드된 S3 key 리스트 (입력 순서)
     """
-    if not raw_data_list:
+    entries = iter(raw_data_list)
+    first = next(entries, None)
+    if first is None:
         return []
 
     config = _get_s3_config(bucket, region)
-    client = _get_s3_client(config)
+    client = _get_s3_client(config, max_pool_connections=max(32, max_workers))
     bucket_name = config["bucket"]
-    bucket_checked = False
-
-    uploaded: list[str] = []
-    skipped = 0
 
-    for entry in raw_data_list:
-        s3_key = (
-            f"{entry['gics_sector']}/"
-            f"{entry['stock_code']}_{entry['year']}_{entry['quarter']}.json"
+    def _upload_one(entry: dict[str, Any]) -> str | None:
+        s3_key = _s3_key(
+            entry["gics_sector"], entry["stock_code"], entry["year"], entry["quarter"],
         )
 
         # ── 중복 체크: S3에 이미 존재하면 스킵 ──
         if not force and _check_s3_exists(client, bucket_name, s3_key):
             print(f"  ☁️  s3://{bucket_name}/{s3_key} → ⏭ 이미 존재 (SKIP)", file=sys.stderr)
-            skipped += 1
-            continue
+            return None
 
-        body = json.dumps(
-            entry["raw_items"], ensure_ascii=False, indent=2
-        ).encode("utf-8")
-
-        try:
-            client.put_object(
-                Bucket=bucket_name, Key=s3_key, Body=body,
-                ContentType="application/json; charset=utf-8",
-            )
-        except client.exceptions.NoSuchBucket:
-            if not bucket_checked:
-                _try_create_bucket(client, bucket_name, config["region"])
-                bucket_checked = True
-                client.put_object(
-                    Bucket=bucket_name, Key=s3_key, Body=body,
-                    ContentType="application/json; charset=utf-8",
-                )
-            else:
-                raise
+        _put_json(client, config, s3_key, _json_dumps(entry["raw_items"]))
 
         s3_uri = f"s3://{bucket_name}/{s3_key}"
-        uploaded.append(s3_uri)
         print(f"  ☁️  {s3_uri}", file=sys.stderr)
-
+        return s3_uri
+
+    # 동시에 처리 중인 업로드 수를 제한해 입력이 제너레이터여도 메모리가 일정하게 유지되고,
+    # 업로드 하나가 실패하면 남은 입력을 더 꺼내지 않고 바로 멈춘다.
+    workers = max(1, max_workers)
+    slots = threading.BoundedSemaphore(2 * workers)
+    failed = threading.Event()
+
+    def _release(future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            failed.set()
+        slots.release()
+
+    futures = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for entry in chain([first], entries):
+            slots.acquire()
+            if failed.is_set():
+                break
+            future = executor.submit(_upload_one, entry)
+            future.add_done_callback(_release)
+            futures.append(future)
+        results = [future.result() for future in futures]
+
+    uploaded = [uri for uri in results if uri is not None]
+    skipped = len(results) - len(uploaded)
     print(
         f"\n✅ S3 업로드 완료: {len(uploaded)}개 업로드, {skipped}개 스킵"
         f" → s3://{config['bucket']}/",